@@ -16,20 +16,103 @@
 import logging
 import os
 import re
+from fractions import Fraction
+from functools import lru_cache
 from math import isclose
 from pathlib import Path
-from typing import Tuple, List, Dict, Union, Iterator
+from string import ascii_letters, digits
+from typing import Tuple, List, Dict, NamedTuple, Optional, Union, Iterator, Pattern
 
 from PIL import Image
 from wand.image import Image as WImage
 
 from cgtcheck.common import Check, Properties
+from cgtcheck.generic.texture_info import texture_info
 from cgtcheck.runners import CheckRunner
 
 
 logger = logging.getLogger(__name__)
 
 
+def _file_state(path: str) -> Tuple[str, int, int]:
+    """
+    Return `(path, mtime, size)` identifying current contents of a file,
+    used as key of memoized per-file probes.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+_SUPPORTED_PNG_MODES = frozenset(("RGB", "RGBA", "P", "L"))
+
+
+@lru_cache(maxsize=4096)
+def _png_depth(path: str, mtime: int, size: int) -> int:
+    """
+    Return bit depth of a PNG image, memoized while the file is unchanged.
+    """
+    with WImage(filename=path) as wimg:
+        return wimg.depth
+
+
+class AspectProperty(NamedTuple):
+    """
+    Record type for texture aspect ratio report properties
+    """
+    name: str
+    aspect: float
+
+
+class ModeProperty(NamedTuple):
+    """
+    Record type for texture image mode report properties
+    """
+    name: str
+    mode: str
+
+
+class ResolutionProperty(NamedTuple):
+    """
+    Record type for texture resolution report properties
+    """
+    name: str
+    resolution: List[int]
+
+
+class MaterialResolutionProperty(NamedTuple):
+    """
+    Record type for texture resolution per material slot report properties
+    """
+    material: str
+    type: str
+    name: str
+    resolution: List[int]
+
+
+class JpegCodingProperty(NamedTuple):
+    """
+    Record type for JPEG coding report properties
+    """
+    name: str
+    coding: Optional[str]
+
+
+class CompressionProperty(NamedTuple):
+    """
+    Record type for BMP compression report properties
+    """
+    name: str
+    compression: Union[str, Tuple]
+
+
+def _as_dicts(properties: List[NamedTuple]) -> List[Dict]:
+    """
+    Convert property records to dictionaries for the report.
+    """
+    return [dict(prop._asdict()) for prop in properties]
+
+
 @CheckRunner.register
 class CheckAspectRatio(Check, Properties):
     """
@@ -53,13 +136,14 @@ class CheckAspectRatio(Check, Properties):
             tex_in_spec = {tex_path for mat in tex_paths.values() for tex_path in mat.values()}
             tex_in_spec = list(tex_in_spec)
             tex_in_spec.sort()
+            ratio = self._exact_ratio(spec_aspect)
 
             for tex_path in tex_in_spec:
                 tex_path_ = Path(tex_path)
                 if not tex_path_.exists():
                     logger.warning('Not found on disk, skipping: %s', tex_path)
                     continue
-                wrong_aspect = self._check_aspect_ratio(tex_path_, spec_aspect)
+                wrong_aspect = self._check_aspect_ratio(tex_path_, spec_aspect, ratio)
                 if wrong_aspect:
                     self.failures.append((tex_path_.name, wrong_aspect, spec_aspect))
 
@@ -82,29 +166,40 @@ class CheckAspectRatio(Check, Properties):
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
-    def _check_aspect_ratio(self, path: Union[str, Path], requirement: float) -> Union[float, None]:
+    @staticmethod
+    def _exact_ratio(requirement: float) -> Optional[Fraction]:
+        """
+        Return requirement as a fraction with small denominator (e.g. 1/1, 2/1, 1/2),
+        or None if the requirement is not exactly representable as such.
+        """
+        try:
+            ratio = Fraction(requirement).limit_denominator(1000)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return ratio if ratio == requirement else None
+
+    def _check_aspect_ratio(
+        self, path: Union[str, Path], requirement: float, ratio: Optional[Fraction] = None
+    ) -> Union[float, None]:
         """
         Check if image matches the aspect ratio.
 
         Arguments:
             path {str | Path} -- path to single texture image file
             requirement {float} -- requirement from specification
+            ratio {Fraction} -- exact requirement, allows comparing sizes without rounding
         """
-        with Image.open(path) as img:
-            width, height = img.size
-            aspect = width / height
-            self.properties.append(
-                {
-                    'name': os.path.basename(path),
-                    'aspect': aspect
-                }
-            )
-            if isclose(aspect, requirement) is False:
-                return aspect
+        width, height = texture_info(path).size
+        aspect = width / height
+        self.properties.append(AspectProperty(os.path.basename(path), aspect))
+        if ratio is not None and width * ratio.denominator == height * ratio.numerator:
             return None
+        if isclose(aspect, requirement) is False:
+            return aspect
+        return None
 
     def get_description(self) -> str:
         """
@@ -135,15 +230,10 @@ class CheckIndexedColors(Check, Properties):
                 if not os.path.exists(texture):
                     logger.warning('Not found on disk, skipping: %s', texture)
                     continue
-                with Image.open(texture) as img:
-                    self.properties.append(
-                        {
-                            'name': os.path.basename(img.filename),
-                            'mode': img.mode
-                        }
-                    )
-                    if img.getpalette():
-                        self.failures.append(os.path.basename(img.filename))
+                info = texture_info(texture)
+                self.properties.append(ModeProperty(os.path.basename(texture), info.mode))
+                if info.has_palette:
+                    self.failures.append(os.path.basename(texture))
 
         return self.failures
 
@@ -169,15 +259,27 @@ class CheckIndexedColors(Check, Properties):
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
 
+@lru_cache(maxsize=4096)
+def _is_plain(path: str, mtime: int, size: int) -> bool:
+    """
+    Return True if texture consists of a single color, memoized while the file is unchanged.
+    """
+    with Image.open(path) as img:
+        return img.getcolors(maxcolors=1) is not None
+
+
 class TextureResolutionBase(Check, Properties):
     """
     Check if texture resolution is within the limit.
     """
 
+    size_key: str = None  # subclass should define a technical requirements key
+    plain_size_key: str = None  # same as above, used for plain (single color) textures
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.failures: Dict[str, List] = {}
@@ -195,10 +297,13 @@ class TextureResolutionBase(Check, Properties):
         other_size_for_plain = min_size_for_plain or max_size_for_plain
 
         if resolution_limit and tex_paths:
-            tex_in_spec = {tex_path for mat in tex_paths.values() for tex_path in mat.values()}
-
-            sorted_tex_paths = sorted(tex_in_spec, key=str.lower)
-            for tex_path in sorted_tex_paths:
+            # decorated with lowercase path, ties are broken by the original path,
+            # so the order doesn't depend on set iteration order
+            sorted_tex_paths = sorted({
+                (tex_path.lower(), tex_path)
+                for mat in tex_paths.values() for tex_path in mat.values()
+            })
+            for _, tex_path in sorted_tex_paths:
                 if not os.path.exists(tex_path):
                     logger.warning('Not found on disk, skipping: %s', tex_path)
                     continue
@@ -236,7 +341,7 @@ class TextureResolutionBase(Check, Properties):
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
     def get_resolution_limit(
@@ -244,9 +349,14 @@ class TextureResolutionBase(Check, Properties):
         tex_path: Union[Path, str] = None
     ) -> List[int]:
         """
-        When implemented should return resolution limits obtained from texture specification.
+        Returns width and height limits obtained from texture specification.
+        If texture path is supplied and texture is plain (single color), plain texture limits
+        are returned instead.
         """
-        raise NotImplementedError('This method should be overriden')
+        size_key = self.size_key
+        if tex_path and _is_plain(*_file_state(tex_path)):
+            size_key = self.plain_size_key
+        return tex_spec.get('technical_requirements', {}).get(size_key, [])
 
     def check_texture_size(self, path: str, requirement: List[int]) -> Tuple[int, int]:
         """
@@ -282,22 +392,8 @@ class CheckMinResolution(TextureResolutionBase):
 
     key = 'textureMinResolution'
     version = (0, 1, 0)
-
-    def get_resolution_limit(
-        self,
-        tex_spec: Dict[str, Dict],
-        tex_path: Union[Path, str] = None
-    ) -> List[int]:
-        """
-        Returns min width and height of texture obtained from texture specification.
-        """
-        if tex_path:
-            with Image.open(tex_path) as img:
-                is_plain = len(img.getcolors()) == 1
-            if is_plain:
-                return tex_spec.get('technical_requirements', {}).get('minSizePlain', [])
-            return tex_spec.get('technical_requirements', {}).get('minSize', [])
-        return tex_spec.get('technical_requirements', {}).get('minSize', [])
+    size_key = 'minSize'
+    plain_size_key = 'minSizePlain'
 
     def check_texture_size(self, path: str, requirement: List[int]) -> Tuple[int, int]:
         """
@@ -310,19 +406,12 @@ class CheckMinResolution(TextureResolutionBase):
         Returns:
             Width and height if they are not within the limit, None otherwise.
         """
-
-        with Image.open(path) as img:
-            width, height = img.size
-            min_width, min_height = requirement
-            self.properties.append(
-                {
-                    'name': os.path.basename(path),
-                    'resolution': [width, height]
-                }
-            )
-            if (width < min_width) or (height < min_height):
-                return width, height
-            return tuple()
+        width, height = texture_info(path).size
+        min_width, min_height = requirement
+        self.properties.append(ResolutionProperty(os.path.basename(path), [width, height]))
+        if (width < min_width) or (height < min_height):
+            return width, height
+        return tuple()
 
 
 @CheckRunner.register
@@ -333,20 +422,8 @@ class CheckMaxResolution(TextureResolutionBase):
 
     key = 'textureMaxResolution'
     version = (0, 1, 0)
-
-    def get_resolution_limit(
-        self, tex_spec: Dict[str, Dict], tex_path: Union[Path, str] = None
-    ) -> List[int]:
-        """
-        Returns max width and height of texture obtained from texture specification.
-        """
-        if tex_path:
-            with Image.open(tex_path) as img:
-                is_plain = len(img.getcolors()) == 1
-            if is_plain:
-                return tex_spec.get('technical_requirements', {}).get('maxSizePlain', [])
-            return tex_spec.get('technical_requirements', {}).get('maxSize', [])
-        return tex_spec.get('technical_requirements', {}).get('maxSize', [])
+    size_key = 'maxSize'
+    plain_size_key = 'maxSizePlain'
 
     def check_texture_size(self, path: str, requirement: List[int]) -> Tuple[int, int]:
         """
@@ -359,18 +436,33 @@ class CheckMaxResolution(TextureResolutionBase):
         Returns:
             Width and height if they are not within the limit, None otherwise.
         """
-        with Image.open(path) as img:
-            width, height = img.size
-            max_width, max_height = requirement
-            self.properties.append(
-                {
-                    'name': os.path.basename(path),
-                    'resolution': [width, height]
-                }
-            )
-            if (width > max_width) or (height > max_height):
-                return width, height
-            return tuple()
+        width, height = texture_info(path).size
+        max_width, max_height = requirement
+        self.properties.append(ResolutionProperty(os.path.basename(path), [width, height]))
+        if (width > max_width) or (height > max_height):
+            return width, height
+        return tuple()
+
+
+_LITERAL_CHARS = frozenset(ascii_letters + digits + '_-')
+
+
+@lru_cache(maxsize=64)
+def _literal_prefix(pattern: Pattern) -> str:
+    """
+    Return literal text every match of a pattern starts with, so that names without it
+    can be rejected without running the regex. Empty if pattern doesn't start with plain
+    characters, has alternatives or isn't case sensitive.
+    """
+    source = pattern.pattern
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE) or '|' in source:
+        return ''
+    end = 0
+    while end < len(source) and source[end] in _LITERAL_CHARS:
+        end += 1
+    if source[end:end + 1] in ('*', '+', '?', '{'):
+        end -= 1  # quantifier applies to the last character
+    return source[:max(end, 0)]
 
 
 @CheckRunner.register
@@ -395,11 +487,15 @@ class CheckNoTexMaterial(Check, Properties):
         regexes = tex_spec.get('parsed_variables', {}).get('notex_mat', {})
 
         if regexes:
+            # accepts both pattern strings and precompiled patterns
+            pattern = re.compile(regexes)
+            prefix = _literal_prefix(pattern)
             self.failures = {
                 matname: [os.path.basename(tex) for tex in textures.values()]
                 for matname, textures in tex_paths.items()
-                if re.match(regexes, matname) and textures and any(os.path.exists(tex) for tex in textures.values())  # noqa E501
+                if matname.startswith(prefix) and pattern.match(matname) and textures and any(os.path.exists(tex) for tex in textures.values())  # noqa E501
             }
+            regexes = pattern.pattern
 
         self.properties = [
             {
@@ -510,7 +606,7 @@ class CheckUnsupportedPNGs(Check, Properties):
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
     def _check_for_unsupported_png(self, tex_dict: Dict[str, str]) -> Dict[str, str]:
@@ -525,23 +621,65 @@ class CheckUnsupportedPNGs(Check, Properties):
                 if not os.path.exists(tex_path):
                     logger.warning('Not found on disk, skipping: %s', tex_path)
                     continue
-                with Image.open(tex_path) as img, WImage(filename=tex_path) as wimg:
-                    if img.format == "PNG":
-                        self.properties.append(
-                            {
-                                'name': os.path.basename(img.filename),
-                                'mode': img.mode
-                            }
-                        )
-                        if img.mode not in ["RGB", "RGBA", "P", "L"]:
-                            unsupported_images[tex_path] = img.mode
-                        elif wimg.depth == 16:
-                            unsupported_images[
-                                tex_path] = "I;16"  # PIL may have such mode
+                info = texture_info(tex_path)
+                if info.format != "PNG":
+                    continue
+                self.properties.append(ModeProperty(os.path.basename(tex_path), info.mode))
+                if info.mode not in _SUPPORTED_PNG_MODES:
+                    unsupported_images[tex_path] = info.mode
+                else:
+                    if _png_depth(*_file_state(tex_path)) == 16:
+                        unsupported_images[tex_path] = "I;16"  # PIL may have such mode
 
         return unsupported_images
 
 
+_JPEG_SOF_ARITHMETIC = frozenset((0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF))
+_JPEG_SOF_HUFFMAN = frozenset((0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7))
+_JPEG_STANDALONE = frozenset((0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8))
+
+
+def _read_jpeg_coding(filepath: str) -> Optional[str]:
+    """
+    Return 'arithmetic' if file is an arithmetic coded JPEG, None otherwise.
+    Only marker segment headers up to the first SOF (or SOS) marker are read,
+    no image data is decoded.
+    """
+    with open(filepath, 'rb') as fh:
+        if fh.read(2) != b'\xff\xd8':
+            return None
+        while True:
+            byte = fh.read(1)
+            if not byte:
+                return None
+            if byte != b'\xff':
+                continue
+            marker = fh.read(1)
+            while marker == b'\xff':  # fill bytes
+                marker = fh.read(1)
+            if not marker:
+                return None
+            marker = marker[0]
+            if marker in _JPEG_SOF_ARITHMETIC:
+                return 'arithmetic'
+            if marker in _JPEG_SOF_HUFFMAN or marker in (0xD9, 0xDA):
+                return None
+            if marker in _JPEG_STANDALONE or marker == 0x00:
+                continue
+            length = fh.read(2)
+            if len(length) < 2:
+                return None
+            fh.seek(int.from_bytes(length, 'big') - 2, os.SEEK_CUR)
+
+
+@lru_cache(maxsize=4096)
+def _jpeg_coding(path: str, mtime: int, size: int) -> Optional[str]:
+    """
+    Memoized `_read_jpeg_coding` of a file, valid while the file is unchanged.
+    """
+    return _read_jpeg_coding(path)
+
+
 @CheckRunner.register
 class CheckArithmeticJpegs(Check, Properties):
     """
@@ -577,7 +715,7 @@ class CheckArithmeticJpegs(Check, Properties):
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
     def _check_jpeg_coding(self, filepath: str) -> bool:
@@ -588,18 +726,10 @@ class CheckArithmeticJpegs(Check, Properties):
         if not os.path.exists(filepath):
             logger.warning('Not found on disk, skipping: %s', filepath)
             return False
-        with WImage(filename=filepath) as wimg:
-            jpeg_coding = wimg.metadata.get('jpeg:coding')
-            if jpeg_coding is None and wimg.metadata.get('jpeg:arithmetic-coding') == 'true':
-                jpeg_coding = 'arithmetic'
-            self.properties.append(
-                {
-                    'name': os.path.basename(filepath),
-                    'coding': jpeg_coding
-                }
-            )
-            if jpeg_coding == 'arithmetic':
-                return True
+        jpeg_coding = _jpeg_coding(*_file_state(filepath))
+        self.properties.append(JpegCodingProperty(os.path.basename(filepath), jpeg_coding))
+        if jpeg_coding == 'arithmetic':
+            return True
 
 
 class TextureCheckMixin:
@@ -621,20 +751,20 @@ class TextureCheckMixin:
             logger.warning('Not found on disk, skipping: %s', args[0])
             return default
 
-        with Image.open(args[0]) as img:
-            first_size = img.size
+        first_size = texture_info(args[0]).size
         for img_path in args[1:]:
             if not os.path.exists(img_path):
                 logger.warning('Not found on disk, skipping: %s', img_path)
                 continue
-            with Image.open(img_path) as img:
-                if img.size != first_size:
-                    return False
+            if texture_info(img_path).size != first_size:
+                return False
 
         return True
 
     @staticmethod
-    def collect_texture_properties(tex_paths: Dict, texture_type: set) -> List[dict]:
+    def collect_texture_properties(
+        tex_paths: Dict, texture_type: set
+    ) -> List[MaterialResolutionProperty]:
         """
         Collect texture properties for selected texture types.
 
@@ -652,15 +782,12 @@ class TextureCheckMixin:
                 if not os.path.exists(texture):
                     logger.warning('Not found on disk, skipping: %s', texture)
                     continue
-                with Image.open(texture) as img:
-                    properties.append(
-                        {
-                            'material': mat,
-                            'type': ttype,
-                            'name': os.path.basename(texture),
-                            'resolution': [img.width, img.height]
-                        }
+                info = texture_info(texture)
+                properties.append(
+                    MaterialResolutionProperty(
+                        mat, ttype, os.path.basename(texture), [info.width, info.height]
                     )
+                )
         return properties
 
     @classmethod
@@ -680,8 +807,8 @@ class TextureCheckMixin:
                         logger.warning('Not found on disk, skipping: %s', ele)
                         continue
                     tex_name.append(os.path.basename(ele))
-                    with Image.open(ele) as img:
-                        tex_res.append(f"{img.width}x{img.height}")
+                    info = texture_info(ele)
+                    tex_res.append(f"{info.width}x{info.height}")
                 return tex_name, tex_res
         return False
 
@@ -727,7 +854,7 @@ class CheckOrmConsistentResolution(Check, Properties, TextureCheckMixin):
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
 
@@ -774,10 +901,29 @@ class CheckColorOpacityConsistentResolution(Check, Properties, TextureCheckMixin
         Format a property report.
         """
         return {
-            'texture': self.properties
+            'texture': _as_dicts(self.properties)
         }
 
 
+_UNSUPPORTED_BMP_COMPRESSION = 'Unsupported BMP compression'
+
+
+@lru_cache(maxsize=4096)
+def _image_compression(path: str, mtime: int, size: int) -> Union[str, int, Tuple, None]:
+    """
+    Return compression of an image as reported by PIL, `_UNSUPPORTED_BMP_COMPRESSION`
+    if PIL refuses to open a BMP due to its compression, or None if it fails otherwise.
+    Memoized while the file is unchanged.
+    """
+    try:
+        with Image.open(path) as img:
+            return img.info.get('compression', ())
+    except OSError as exc:
+        if exc.args[0].startswith(_UNSUPPORTED_BMP_COMPRESSION):
+            return _UNSUPPORTED_BMP_COMPRESSION
+        return None
+
+
 @CheckRunner.register
 class CheckUnsupportedBmpCompression(Check, Properties):
     """
@@ -798,25 +944,12 @@ class CheckUnsupportedBmpCompression(Check, Properties):
             if not os.path.exists(tex):
                 logger.warning('Not found on disk, skipping: %s', tex)
                 continue
-            try:
-                with Image.open(tex) as img:
-                    img.info
-                    self.properties.append(
-                        {
-                            'name': os.path.basename(tex),
-                            'compression': img.info.get('compression', ())
-                        }
-                    )
-
-            except OSError as exc:
-                if exc.args[0].startswith('Unsupported BMP compression'):
-                    self.failures.append(os.path.basename(tex))
-                    self.properties.append(
-                        {
-                            'name': os.path.basename(tex),
-                            'compression': 'Unsupported BMP compression'
-                        }
-                    )
+            compression = _image_compression(*_file_state(tex))
+            if compression == _UNSUPPORTED_BMP_COMPRESSION:
+                self.failures.append(os.path.basename(tex))
+                self.properties.append(CompressionProperty(os.path.basename(tex), compression))
+            elif compression is not None:
+                self.properties.append(CompressionProperty(os.path.basename(tex), compression))
 
         return self.failures
 
@@ -835,7 +968,7 @@ class CheckUnsupportedBmpCompression(Check, Properties):
         Format a property report to be .
         """
         return {
-            'textures': self.properties
+            'textures': _as_dicts(self.properties)
         }
 
 
@@ -863,15 +996,10 @@ class CheckTextureAlphaChannel(Check, Properties):
                     logger.warning('Not found on disk, skipping: %s', texture)
                     continue
                 texture_name = os.path.basename(texture)
-                with Image.open(texture) as img:
-                    self.properties.append(
-                        {
-                            'name': texture_name,
-                            'mode': img.mode
-                        }
-                    )
-                    if img.mode in self.forbidden_modes and textures_to_check.get(slot, False):
-                        self.failures.append(texture_name)
+                mode = texture_info(texture).mode
+                self.properties.append(ModeProperty(texture_name, mode))
+                if mode in self.forbidden_modes and textures_to_check.get(slot, False):
+                    self.failures.append(texture_name)
 
         return self.failures
 
@@ -889,5 +1017,5 @@ class CheckTextureAlphaChannel(Check, Properties):
         Format a property report.
         """
         return {
-            'textures': self.properties
+            'textures': _as_dicts(self.properties)
         }
@@ -15,9 +15,13 @@
 """
 Common functionality for generic tests
 """
+import logging
 import os
 import sys
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import Union
 from base64 import b85decode
 from zlib import decompress
 
@@ -26,12 +30,50 @@ import pytest
 from PIL import Image
 
 
+def pytest_configure(config):
+    # registered here too, so grouping below doesn't warn when pytest-xdist isn't installed
+    config.addinivalue_line(
+        'markers', 'xdist_group(name): run tests of the same group on a single xdist worker'
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Groups tests by class, so that with `pytest -n auto --dist=loadgroup` all tests of a class
+    run on the same worker and share its spec and module scoped textures.
+    """
+    for item in items:
+        if item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(name=item.cls.__name__))
+
+
+@pytest.fixture(scope='session', autouse=True)
+def configure_logging():
+    """
+    Configures logging once per test session.
+    """
+    logging.basicConfig(format='%(levelname)s - %(name)s: %(message)s', level=logging.INFO)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_up_checks():
+    """
+    Imports checks and builds a runner once per session, so loading of check metadata and
+    collector modules isn't paid for by whichever test happens to run first.
+    """
+    import cgtcheck.runners
+
+    cgtcheck.runners.CheckRunner.import_dcc_checks()
+    cgtcheck.runners.CheckRunner(checks_spec={}, checks_data={})
+
+
+@lru_cache(maxsize=None)
 def is_compatible_blender() -> bool:
     """
     Returns True if code is running in compatible Blender.
     """
 
-    if not os.path.basename(sys.argv[0]).lower() in ('blender', 'blender.exe'):
+    if not Path(sys.argv[0]).name.lower() in ('blender', 'blender.exe'):
         return False
 
     try:
@@ -42,12 +84,13 @@ def is_compatible_blender() -> bool:
     return True
 
 
+@lru_cache(maxsize=None)
 def is_compatible_3dsmax() -> bool:
     """
     Returns True if code is running in compatible 3dsmax.
     """
 
-    if not os.path.basename(sys.executable).lower() in ('3dsmax.exe', '3dsmaxio.exe'):
+    if not Path(sys.executable).name.lower() in ('3dsmax.exe', '3dsmaxio.exe'):
         return False
 
     try:
@@ -65,14 +108,102 @@ def is_compatible_3dsmax() -> bool:
     return True
 
 
-@pytest.fixture
-def create_texture_aspect_ratio_correct(tmpdir: str) -> Path:
+# PNG encodings of the most common fixture images, kept as literals so PIL encoder isn't needed
+# for them at all. They are deflated at PIL's default level, so their bytes differ from what
+# `_encoded_image` and `_encoded_indexed_png` below encode, but they decode to the same pixels.
+_PREBUILT_IMAGES = {
+    ('RGB', (1, 1), 'white', '.png'): (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00'
+        b'\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\xff\xff?\x00\x05\xfe\x02\xfe\r'
+        b'\xefF\xb8\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    ('RGB', (4, 4), 'white', '.png'): (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x04\x00\x00\x00\x04\x08\x02\x00'
+        b'\x00\x00&\x93\t)\x00\x00\x00\x14IDATx\x9cc\xfc\xff\xff?\x03\x0c01 \x01\xdc\x1c'
+        b'\x00\x96n\x03\x05\xf2%\xbe\xf9\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    ('RGB', (5, 5), 'white', '.png'): (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x05\x00\x00\x00\x05\x08\x02\x00'
+        b'\x00\x00\x02\r\xb1\xb2\x00\x00\x00\x14IDATx\x9cc\xfc\xff\xff?\x03\x12`b@\x05\xa4'
+        b'\xf2\x01\xea\xf6\x03\x07\x17\xf6\xb5d\x00\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    ('RGB', (25, 25), 'white', '.png'): (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x19\x00\x00\x00\x19\x08\x02\x00'
+        b'\x00\x00K\x8b\x124\x00\x00\x00#IDATx\x9cc\xfc\xff\xff?\x03\x95\x00\x13\xb5\x0c'
+        b'\x1a5k\xd4\xacQ\xb3F\xcd\x1a5k\xd4\xacad\x16\x00\xea\x04\x03/\x9b.\x85\xdb\x00'
+        b'\x00\x00\x00IEND\xaeB`\x82'
+    ),
+    ('RGB', (50, 25), 'white', '.png'): (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x002\x00\x00\x00\x19\x08\x02\x00\x00'
+        b'\x00\xfc6\xea\x13\x00\x00\x009IDATx\x9c\xed\xce1\x01\x000\x0c\xc3\xb0\xae\xfc9g'
+        b'\x04\xf6\xf8Z\x0e\x0b\x81N\x92\xe9\xb3\xbf\x03o\xb6\x08[\x84-\xc2\x16a\x8b\xb0E'
+        b'\xd8"l\x11\xb6\x08[\x84-\xa2\xb4u\x01\x8c\xd2\x03/E8\xfcq\x00\x00\x00\x00IEND'
+        b'\xaeB`\x82'
+    ),
+    ('P', (4, 4), 'white', '.png'): (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x04\x00\x00\x00\x04\x01\x03\x00'
+        b'\x00\x00\x93?\x0c=\x00\x00\x00\x03PLTE\xff\xff\xff\xa7\xc4\x1b\xc8\x00\x00\x00'
+        b'\x0bIDATx\x9cc`\x80\x00\x00\x00\x08\x00\x01\xb7Xs\x95\x00\x00\x00\x00IEND\xaeB`'
+        b'\x82'
+    ),
+}
+
+
+# Decoded test images are the same at any compression level, skip deflating them
+_SAVE_OPTIONS = {
+    'PNG': {'compress_level': 0, 'optimize': False},
+}
+
+
+@lru_cache(maxsize=None)
+def _encoded_image(mode: str, size: tuple, color: str, extension: str = '.png') -> bytes:
+    """
+    Returns single color image encoded in format matching file extension,
+    encoded once per distinct arguments.
+    """
+    prebuilt = _PREBUILT_IMAGES.get((mode, size, color, extension.lower()))
+    if prebuilt is not None:
+        return prebuilt
+
+    buffer = BytesIO()
+    image_format = Image.registered_extensions()[extension.lower()]
+    Image.new(mode, size, color=color).save(
+        buffer, format=image_format, **_SAVE_OPTIONS.get(image_format, {})
+    )
+    return buffer.getvalue()
+
+
+def _write_image(path: Union[str, Path], mode: str, size: tuple, color: str = 'white') -> None:
+    """
+    Writes single color image to path, format is derived from the extension like in `Image.save`.
+    """
+    content = _encoded_image(mode, size, color, os.path.splitext(path)[1])
+    Path(path).write_bytes(content)
+
+
+@lru_cache(maxsize=None)
+def _encoded_indexed_png(size: tuple, color: str) -> bytes:
+    """
+    Returns PNG encoded single color image converted to an adaptive palette.
+    """
+    prebuilt = _PREBUILT_IMAGES.get(('P', size, color, '.png'))
+    if prebuilt is not None:
+        return prebuilt
+
+    buffer = BytesIO()
+    img = Image.new('RGB', size, color=color)
+    img = img.convert("P", palette=Image.ADAPTIVE, colors=16)
+    img.save(buffer, format='PNG', **_SAVE_OPTIONS['PNG'])
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope='module')
+def create_texture_aspect_ratio_correct(tmp_path_factory: pytest.fixture) -> Path:
     """
     Creates a texture with the correct aspect ratio.
     """
-    img = Image.new('RGB', (25, 25), color='white')
-    texture_path = Path(tmpdir) / 'texture_aspect_ratio_correct.png'
-    img.save(texture_path)
+    texture_path = tmp_path_factory.mktemp('aspect_ratio') / 'texture_aspect_ratio_correct.png'
+    _write_image(texture_path, 'RGB', (25, 25))
     yield texture_path
 
 
@@ -81,69 +212,65 @@ def create_texture_with_incorrect_name(tmpdir: str) -> Path:
     """
     Creates a texture with incorrect name
     """
-    img = Image.new('RGB', (1, 1), color='white')
     texture_path = os.path.join(tmpdir, 'textureName.png')
-    img.save(texture_path)
+    _write_image(texture_path, 'RGB', (1, 1))
     yield texture_path
 
 
-@pytest.fixture
-def create_texture_aspect_ratio_wrong(tmpdir: str) -> Path:
+@pytest.fixture(scope='module')
+def create_texture_aspect_ratio_wrong(tmp_path_factory: pytest.fixture) -> Path:
     """
     Creates a texture with the wrong aspect ratio.
     """
-    texture_path = Path(tmpdir) / 'texture_aspect_ratio_wrong.png'
-    img = Image.new('RGB', (50, 25), color='white')
-    img.save(texture_path)
+    texture_path = tmp_path_factory.mktemp('aspect_ratio') / 'texture_aspect_ratio_wrong.png'
+    _write_image(texture_path, 'RGB', (50, 25))
     yield texture_path
 
 
-@pytest.fixture
-def indexed_colors_image(tmpdir) -> str:
-    texture_path = os.path.join(tmpdir, 'indexed_colors_texture.png')
-
-    img = Image.new('RGB', (4, 4), color='white')
-    img = img.convert("P", palette=Image.ADAPTIVE, colors=16)
-    img.save(texture_path)
+@pytest.fixture(scope='module')
+def indexed_colors_image(tmp_path_factory) -> str:
+    texture_path = os.path.join(tmp_path_factory.mktemp('colors'), 'indexed_colors_texture.png')
+    Path(texture_path).write_bytes(_encoded_indexed_png((4, 4), 'white'))
 
     return texture_path
 
 
-@pytest.fixture
-def non_indexed_colors_image(tmpdir) -> str:
-    texture_path = os.path.join(tmpdir, 'non_indexed_colors_texture.png')
-
-    img = Image.new('RGB', (4, 4), color='white')
-    img.save(texture_path)
+@pytest.fixture(scope='module')
+def non_indexed_colors_image(tmp_path_factory) -> str:
+    texture_path = os.path.join(
+        tmp_path_factory.mktemp('colors'), 'non_indexed_colors_texture.png'
+    )
+    _write_image(texture_path, 'RGB', (4, 4))
 
     return texture_path
 
 
-@pytest.fixture
-def textures_with_res(tmpdir: pytest.fixture, request: pytest.fixture) -> str:
-
+@pytest.fixture(scope='module')
+def textures_with_res(tmp_path_factory: pytest.fixture, request: pytest.fixture) -> str:
+    """
+    Creates textures with given resolutions, returns their paths sorted.
+    Textures are shared by tests of the module requesting the same parameters.
+    """
+    root = os.fspath(tmp_path_factory.mktemp('textures_with_res'))
     texture_paths = []
 
     for texture_id, resolution in enumerate(request.param, start=1):
-        texture_path = os.path.join(tmpdir, 'texture_{}.png'.format(texture_id))
-        width, height = resolution
-        img = Image.new('RGB', (width, height), color='white')
-        img.save(texture_path)
+        texture_path = os.path.join(root, 'texture_{}.png'.format(texture_id))
+        _write_image(texture_path, 'RGB', tuple(resolution))
         texture_paths.append(texture_path)
 
-    return texture_paths
+    return sorted(texture_paths)
 
 
 @pytest.fixture
 def textures_with_mat_name_and_types(tmpdir: pytest.fixture, request: pytest.fixture) -> str:
-
+    root = os.fspath(tmpdir)
     texture_paths = []
 
     for mat_name, texture_types in request.param.items():
         for texture_type in texture_types:
-            texture_path = os.path.join(tmpdir, '{}_{}.png'.format(mat_name, texture_type))
-            img = Image.new('RGB', (1, 1), color='white')
-            img.save(texture_path)
+            texture_path = os.path.join(root, '{}_{}.png'.format(mat_name, texture_type))
+            _write_image(texture_path, 'RGB', (1, 1))
             texture_paths.append(texture_path)
 
     return texture_paths
@@ -153,63 +280,65 @@ def textures_with_mat_name_and_types(tmpdir: pytest.fixture, request: pytest.fix
 def file_on_top_of_multiple_formats_textures_hierarchy(
     tmpdir: pytest.fixture, request: pytest.fixture
 ) -> str:
-    for texture_subpath in request.param:
-        path = os.path.join(tmpdir, texture_subpath)
-        directory = os.path.dirname(path)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+    root = os.fspath(tmpdir)
+    paths = [os.path.join(root, texture_subpath) for texture_subpath in request.param]
+    for directory in {os.path.dirname(path) for path in paths}:
+        os.makedirs(directory, exist_ok=True)
 
-        img = Image.new('RGB', (5, 5), color='white')
-        img.save(path)
+    for path in paths:
+        _write_image(path, 'RGB', (5, 5))
 
-    input_file_path = os.path.join(tmpdir, 'input.txt')
+    input_file_path = os.path.join(root, 'input.txt')
     open(input_file_path, 'a').close()
 
     return input_file_path
 
 
-@pytest.fixture
-def textures_with_mode(tmpdir: pytest.fixture, request: pytest.fixture) -> str:
+@pytest.fixture(scope='module')
+def textures_with_mode(tmp_path_factory: pytest.fixture, request: pytest.fixture) -> str:
+    """
+    Creates textures with given names and modes, returns their paths in given order.
+    Textures are shared by tests of the module requesting the same parameters.
+    """
+    root = os.fspath(tmp_path_factory.mktemp('textures_with_mode'))
     texture_paths = []
     for texture_name, mode in request.param:
-        texture_path = os.path.join(tmpdir, texture_name)
-
-        img = Image.new(mode, (5, 5), color='white')
-        img.save(texture_path)
+        texture_path = os.path.join(root, texture_name)
+        _write_image(texture_path, mode, (5, 5))
         texture_paths.append(texture_path)
 
     return texture_paths
 
 
+arithmetic_coded_jpg_content = b85decode(b'|JeWF01!$>Nk#wx0RaF=07w7;|JwjV00RO70|EjA0|NsD0|NvF2n7WM1O*BQ2L=cX3JeSj3JVJj4iXRz4iOFu3lJ6%5fc;@6%`B*7Z?^47!ni}6#v@*LjeN>1O)^I2?YfS6b%av6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6cqo-01*fPKmb4k0TBQK5di}c0sqVZ3IGrg1pyEd1^?Or3<CiG0ucid06zf#0Mh58Nw6VRRVX~fbZs(nXSw(*bGzC90L=B=zBkLaeu!9+0VUUe51SK^0kFL-n+q6ehaUv2$J5`>@H|^sygLhk{{Z0vAr@6eDPSBAebOUQO4N=lBQXgb@xWK`ohu&u*fF;q<n~Fq&QjWoXg!crb;ap`R|o8YoK_*pH)~)H%t~%>y71@RrZr+`IZ`}4{SGv^W)7k%sWypY9jj0+k8$X)eaddnP9_z^84aKSSRQ?<*rARf;2ZD9V%(L;a2`KEzRx7F2aMd7NY|-<ra%eufe-pYjQ;@f-nXIRbOj*nHIN8E{{Z*!@~Lw|aQQ-Zwyr1kK?T&|4*FMp%2u{ux8Zr?OuAzLD+<Lvg&3&FzkYI^hzny*y?=mc>H+sSAq)$1_PumQ^~{)5a^VUDNJ~uLny&Pq%o-z`xv~73LGXLd4#zV3Y0F#4q#c`Ktrho5Mm{a`SRs0_YS@Pp1LjlS0#;luM(mRkC$s1pqm7yk;h%Lo)1S9H5RQacT|Cw8-ZHZ3X^M7@`VXNBK&tjBkzB_D*42vYU@T_}Z4M18Z9J&te|6g}$}_WlvFm~r43UdH%tn#<n<V9}GRs3F^dgt-pd2c>PO_efrIzY`?Q<i%x~$=o68``e%x6*F*bsU^nfpTp7LdyrLzn09vH7M|mmH{@O}coDu9W!^#-r}tKk{;^;Oi*}xzJDG-W}d@&yQp^{JyWRycu_)<t%9w&Er+enQ>HlVXf-|F&Pw=O38s=%QlgzI7Om#qmYtY?KLE(+`Xe<_ueY)4`1){%no!4Yihi6$45=sC2`EJ{{YL#+NNf=43PdOZ|`sqK%hVxOw5-9t(o`({W6+?T|fEgmwj#)#AIqd4th~tUAqNOonNWb4VRL8L!<FKxhYr8)cKw&AKjFj5+t*O!9wS^vHfH|nxjcg^}jGUs*D7KU%E}tcz9{*q(bc8^q-?PS9JsJXws1S0wc;I*at%NrWwA#^9_M9K;zt#U70gr#hxuad<y|aIUbjyzU(jzI=hs2i8P$c-Ys}aq6A2ZDaxTxU^qc_&8?b1G=fEl9<nRMES_m>^!K(P+KS#QcDwnHtrXyAN@#{7QH)am0P6AC%u)1r_c8J@evn`(2tBgxf?2;5zACJZ{A&LIBNYZ>U^db#C<>c6j|8X5j9hn_ug8rkb;ZLGa7}E2L0tRqMQ-(x8(@_Fs{s;kKt9%e7#<nbDbCk*q#`sOb%)gBqz#fiBoYt1ZR}uc0<HJgDqQ#~%YWfnQ;l+svaEc6xna+6f`E=Y_IVC^yipMh@CHv$?abLv4i{YwoMtdTW~kCRGjs{XZL}TSBOANvcCvQP4m0gLjz%Olk0TRjNVfDofTc68La2wRgaI_CO#uirYFE+N6`br@ZOua-n1}rjrD@vi?y9uA&B50X&Z`d~WW%;1GJUCY2hYUq!1GfU?hwq((k9RF4}Ur#xkADhuvb8v`Vlu7b{obv*lmshoBsgV596a#d#xqxcYvG313Tfn{0_ci0Ff>K0PE~4{feepDv+wSqBl#8RS4-7^{Z*-q+}^DVfHYE{g?H{8}i$AspXf;dkeR^TqQ^9{mBF9M33WvCe;lO%r~VR^4lcUrcmPPXt1%$@}*E3)oKoOi(%6l&TA}A=zfT3>(PH!jxLaShJkG4qf-86<@%ZrwsY_3!oGu~Uamde`X!;c%X_(VOr6J>sdx^MVBb7X<I#mz*%qFnfsHSbYPQXgzx<83e0w6MofCKBS(bmxn<YWk_{t2B3zk_DzeBPnJ429YIK!6VFv!jS00y(fxxY)G1^wT@WVdZ@#u4A&N4^QcTJjvXE?7Gzv~d5~')  # noqa E501
+
+
 @pytest.fixture
 def arithmetic_coded_jpg(tmpdir: pytest.fixture) -> str:
-    content = b85decode(b'|JeWF01!$>Nk#wx0RaF=07w7;|JwjV00RO70|EjA0|NsD0|NvF2n7WM1O*BQ2L=cX3JeSj3JVJj4iXRz4iOFu3lJ6%5fc;@6%`B*7Z?^47!ni}6#v@*LjeN>1O)^I2?YfS6b%av6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6ciK`6cqo-01*fPKmb4k0TBQK5di}c0sqVZ3IGrg1pyEd1^?Or3<CiG0ucid06zf#0Mh58Nw6VRRVX~fbZs(nXSw(*bGzC90L=B=zBkLaeu!9+0VUUe51SK^0kFL-n+q6ehaUv2$J5`>@H|^sygLhk{{Z0vAr@6eDPSBAebOUQO4N=lBQXgb@xWK`ohu&u*fF;q<n~Fq&QjWoXg!crb;ap`R|o8YoK_*pH)~)H%t~%>y71@RrZr+`IZ`}4{SGv^W)7k%sWypY9jj0+k8$X)eaddnP9_z^84aKSSRQ?<*rARf;2ZD9V%(L;a2`KEzRx7F2aMd7NY|-<ra%eufe-pYjQ;@f-nXIRbOj*nHIN8E{{Z*!@~Lw|aQQ-Zwyr1kK?T&|4*FMp%2u{ux8Zr?OuAzLD+<Lvg&3&FzkYI^hzny*y?=mc>H+sSAq)$1_PumQ^~{)5a^VUDNJ~uLny&Pq%o-z`xv~73LGXLd4#zV3Y0F#4q#c`Ktrho5Mm{a`SRs0_YS@Pp1LjlS0#;luM(mRkC$s1pqm7yk;h%Lo)1S9H5RQacT|Cw8-ZHZ3X^M7@`VXNBK&tjBkzB_D*42vYU@T_}Z4M18Z9J&te|6g}$}_WlvFm~r43UdH%tn#<n<V9}GRs3F^dgt-pd2c>PO_efrIzY`?Q<i%x~$=o68``e%x6*F*bsU^nfpTp7LdyrLzn09vH7M|mmH{@O}coDu9W!^#-r}tKk{;^;Oi*}xzJDG-W}d@&yQp^{JyWRycu_)<t%9w&Er+enQ>HlVXf-|F&Pw=O38s=%QlgzI7Om#qmYtY?KLE(+`Xe<_ueY)4`1){%no!4Yihi6$45=sC2`EJ{{YL#+NNf=43PdOZ|`sqK%hVxOw5-9t(o`({W6+?T|fEgmwj#)#AIqd4th~tUAqNOonNWb4VRL8L!<FKxhYr8)cKw&AKjFj5+t*O!9wS^vHfH|nxjcg^}jGUs*D7KU%E}tcz9{*q(bc8^q-?PS9JsJXws1S0wc;I*at%NrWwA#^9_M9K;zt#U70gr#hxuad<y|aIUbjyzU(jzI=hs2i8P$c-Ys}aq6A2ZDaxTxU^qc_&8?b1G=fEl9<nRMES_m>^!K(P+KS#QcDwnHtrXyAN@#{7QH)am0P6AC%u)1r_c8J@evn`(2tBgxf?2;5zACJZ{A&LIBNYZ>U^db#C<>c6j|8X5j9hn_ug8rkb;ZLGa7}E2L0tRqMQ-(x8(@_Fs{s;kKt9%e7#<nbDbCk*q#`sOb%)gBqz#fiBoYt1ZR}uc0<HJgDqQ#~%YWfnQ;l+svaEc6xna+6f`E=Y_IVC^yipMh@CHv$?abLv4i{YwoMtdTW~kCRGjs{XZL}TSBOANvcCvQP4m0gLjz%Olk0TRjNVfDofTc68La2wRgaI_CO#uirYFE+N6`br@ZOua-n1}rjrD@vi?y9uA&B50X&Z`d~WW%;1GJUCY2hYUq!1GfU?hwq((k9RF4}Ur#xkADhuvb8v`Vlu7b{obv*lmshoBsgV596a#d#xqxcYvG313Tfn{0_ci0Ff>K0PE~4{feepDv+wSqBl#8RS4-7^{Z*-q+}^DVfHYE{g?H{8}i$AspXf;dkeR^TqQ^9{mBF9M33WvCe;lO%r~VR^4lcUrcmPPXt1%$@}*E3)oKoOi(%6l&TA}A=zfT3>(PH!jxLaShJkG4qf-86<@%ZrwsY_3!oGu~Uamde`X!;c%X_(VOr6J>sdx^MVBb7X<I#mz*%qFnfsHSbYPQXgzx<83e0w6MofCKBS(bmxn<YWk_{t2B3zk_DzeBPnJ429YIK!6VFv!jS00y(fxxY)G1^wT@WVdZ@#u4A&N4^QcTJjvXE?7Gzv~d5~')  # noqa E501
-
     texture_path = os.path.join(tmpdir, 'arithmetic_coded.jpg')
-    with open(texture_path, 'wb') as f:
-        f.write(content)
+    Path(texture_path).write_bytes(arithmetic_coded_jpg_content)
 
     return texture_path
 
 
+bmp_with_unsupported_compression_content = decompress(b85decode(b'c${<c-N3>C23<h921v6(F(U&95Hm2S0kIG_1cL=YnBhMRfjLg@LB$P+zG@`wkP}sCea+}#Y%JW6mZs*Amd3VV=1fi-uItPyG5tmiNPvX_6a4@GAB;!AC>RAJ3$QUV5hNKH0V~=X`2'))  # noqa #501
+
+
 @pytest.fixture
 def bmp_with_unsupported_compression(tmpdir: pytest.fixture) -> str:
-    content = decompress(b85decode(b'c${<c-N3>C23<h921v6(F(U&95Hm2S0kIG_1cL=YnBhMRfjLg@LB$P+zG@`wkP}sCea+}#Y%JW6mZs*Amd3VV=1fi-uItPyG5tmiNPvX_6a4@GAB;!AC>RAJ3$QUV5hNKH0V~=X`2'))  # noqa #501
-
     texture_path = os.path.join(tmpdir, 'unsupported_compression.bmp')
-    with open(texture_path, 'wb') as f:
-        f.write(content)
+    Path(texture_path).write_bytes(bmp_with_unsupported_compression_content)
 
     return texture_path
 
 
+default_fbx_binary_content = decompress(b85decode(b'c$~#oUu+ab7~lT6-nG4}fC36=&jgX8ZLgpL#t7||gH3yF(``}F#7y_*+J(K{%j|4z6C^Pv#s`fiCdPyZjBm!EsL>}Ajq=b3|HYW7FFdFiNPWNuq7f4PzL~x5EZ1!j9-QoLXXpFA-}iUEnGTWp5@94;7<fE8U^#@%XS3QS?ZOsK8%t_SV;#^BQBtDpz#ONJXSvQ(u-pK@1pL-4kq=XbM18SI)8-V8HsGky5c~~=)^Wfw*?g4)ZDPJkbyWCVL#TXho>3yGR)rdzRI1-7(#a)QP<dV<G(SNJ(|-dmt}3gEqU-P(y%ljA!sVtxGOurd$-T;A^C8z~dKzZ?l+~7^<@lTm?#I-1gPN{W(mP?!mG$<bW!sh~iQhG8(Q!85>_u0Eqb@Ucz{h}19SCT4yT{3tO+|+E(XMQFc4yDtT|Ip{m_5+56J~jEu@Oy&U#nqKhw4t*HP*xDLED`oHhyXiAteQrNsqEY!bxYN)Sp3rG5itgp2lSYU4oC4;zz1TIYI7n9QU&dAu(Zbn;Iziy2@|(Q%9-E1>s$V(9-Yo8Hfq4FDUD&Av*tz%SxW0{H#*O>8ypi1?7sWB=1%#)R9Ue;~}Nk(__r7QpPRn?as|KNzuJnLt{oe{26pjA5kWmZJ^kY!I|Yu8yFH?Lkz*#TXrG*tfxFR_dx*jh=l1t7G~ZE(yu^lhNZ0%39~iItZCT0w)g-StFG^qq%gi7ZI-%+rNkyh;&^|xYFnn*U5BCGAkL~COAy97r6LOmFGNlT$fFYZ_88<50{eD(+>P;-z8HWHNbt?EW{WzD!N=8LzZ4P@uPE`>t9Veo6uZmQ2a6LTinWDnOwIN6!qc~RcP^XDJuIG{TrT%&B9h&;Ds;iJ=?Ve3Cc9rGWOnb7NZ6)^iN_5xOG`27y{jeS*Jf4ZCi8ndfF6_3cf>*8Sc1O_(DM>~OT6LNnc=Ra1RRlo8zO)=nPTnw##~Z%8?3GtOub$jUjy^)AMRNEc<Yy+f4XpH$J_T^{o{1Nhfb#>=NsC9+Piao@MQY}8{o-ZO5XHY;iN-bJLKtLP|hKw-quvip-L2)NN?mR$=xO64e8V-tNnA9CmNUqeHN3WJDg5a*}!#F@LnL+EydbGF>BgcS@dEcdVjb*3JebPm6eLau~kauq+}){xvE~$TBkSf!r`;BUVNRZ*BeT%s`p$V-KQ-b8@0x=TBQGhad(>(e^83As~2C@g6RNakA%1dljT_4Fo{hI#Ka23yq8=b3QtT&{K`~-Fer=W(!P%Zl>HKAqiV>1M{9?siN+q1Xjq>8l_?7j(!6T}gzS?r8$UQ;Bx)Zj#&VM*?b62nFjIrHOnjT?p}jE@(|>M*7i@}>Z^8x~gKblVTZ}bJUk>1cPL4L={w}&DYG8+_j$a93bUX*X4n%f^7KoNmB@SGB85h0`iKXTm4TXnmE_9?Nz|Jr*A%I(rl|S>th0kysPNeISo%cQNRtgM4Fb)lK_4Mr7uf>ixGvU0ocKPv6rj^@a9u6NaD(^L5#?rhKeyJMs@LL0Jr-&MIiz{t7n^E8+jcQXyo~qlzxEOG?H|eOnbD}41c>NTwCo_>`+=`VU65H=s6-bA9Y=u*=&hr;C(nstZsd3lkBTxs!b!>Ixtm0DJI4x5~9g}(yp6QNo-VP;e!H$C7?Oo2qT*uQL%Le>Nu#B#@$;gO*2oOGcR1}v7h#xO1CMG3x)Q8im4|&&da1((K5vKDBQ(}S~qu!5-A<4YY*s_=V$oTt{cUr$)_`dx9?3L%Y{JHH!l#2hG{$Jy-BQG62cloCizh6xM;=j_>{x4KN@aF'))  # noqa #501
+
+
 @pytest.fixture
 def default_fbx_binary_file(tmpdir: pytest.fixture) -> str:
-    content = decompress(b85decode(b'c$~#oUu+ab7~lT6-nG4}fC36=&jgX8ZLgpL#t7||gH3yF(``}F#7y_*+J(K{%j|4z6C^Pv#s`fiCdPyZjBm!EsL>}Ajq=b3|HYW7FFdFiNPWNuq7f4PzL~x5EZ1!j9-QoLXXpFA-}iUEnGTWp5@94;7<fE8U^#@%XS3QS?ZOsK8%t_SV;#^BQBtDpz#ONJXSvQ(u-pK@1pL-4kq=XbM18SI)8-V8HsGky5c~~=)^Wfw*?g4)ZDPJkbyWCVL#TXho>3yGR)rdzRI1-7(#a)QP<dV<G(SNJ(|-dmt}3gEqU-P(y%ljA!sVtxGOurd$-T;A^C8z~dKzZ?l+~7^<@lTm?#I-1gPN{W(mP?!mG$<bW!sh~iQhG8(Q!85>_u0Eqb@Ucz{h}19SCT4yT{3tO+|+E(XMQFc4yDtT|Ip{m_5+56J~jEu@Oy&U#nqKhw4t*HP*xDLED`oHhyXiAteQrNsqEY!bxYN)Sp3rG5itgp2lSYU4oC4;zz1TIYI7n9QU&dAu(Zbn;Iziy2@|(Q%9-E1>s$V(9-Yo8Hfq4FDUD&Av*tz%SxW0{H#*O>8ypi1?7sWB=1%#)R9Ue;~}Nk(__r7QpPRn?as|KNzuJnLt{oe{26pjA5kWmZJ^kY!I|Yu8yFH?Lkz*#TXrG*tfxFR_dx*jh=l1t7G~ZE(yu^lhNZ0%39~iItZCT0w)g-StFG^qq%gi7ZI-%+rNkyh;&^|xYFnn*U5BCGAkL~COAy97r6LOmFGNlT$fFYZ_88<50{eD(+>P;-z8HWHNbt?EW{WzD!N=8LzZ4P@uPE`>t9Veo6uZmQ2a6LTinWDnOwIN6!qc~RcP^XDJuIG{TrT%&B9h&;Ds;iJ=?Ve3Cc9rGWOnb7NZ6)^iN_5xOG`27y{jeS*Jf4ZCi8ndfF6_3cf>*8Sc1O_(DM>~OT6LNnc=Ra1RRlo8zO)=nPTnw##~Z%8?3GtOub$jUjy^)AMRNEc<Yy+f4XpH$J_T^{o{1Nhfb#>=NsC9+Piao@MQY}8{o-ZO5XHY;iN-bJLKtLP|hKw-quvip-L2)NN?mR$=xO64e8V-tNnA9CmNUqeHN3WJDg5a*}!#F@LnL+EydbGF>BgcS@dEcdVjb*3JebPm6eLau~kauq+}){xvE~$TBkSf!r`;BUVNRZ*BeT%s`p$V-KQ-b8@0x=TBQGhad(>(e^83As~2C@g6RNakA%1dljT_4Fo{hI#Ka23yq8=b3QtT&{K`~-Fer=W(!P%Zl>HKAqiV>1M{9?siN+q1Xjq>8l_?7j(!6T}gzS?r8$UQ;Bx)Zj#&VM*?b62nFjIrHOnjT?p}jE@(|>M*7i@}>Z^8x~gKblVTZ}bJUk>1cPL4L={w}&DYG8+_j$a93bUX*X4n%f^7KoNmB@SGB85h0`iKXTm4TXnmE_9?Nz|Jr*A%I(rl|S>th0kysPNeISo%cQNRtgM4Fb)lK_4Mr7uf>ixGvU0ocKPv6rj^@a9u6NaD(^L5#?rhKeyJMs@LL0Jr-&MIiz{t7n^E8+jcQXyo~qlzxEOG?H|eOnbD}41c>NTwCo_>`+=`VU65H=s6-bA9Y=u*=&hr;C(nstZsd3lkBTxs!b!>Ixtm0DJI4x5~9g}(yp6QNo-VP;e!H$C7?Oo2qT*uQL%Le>Nu#B#@$;gO*2oOGcR1}v7h#xO1CMG3x)Q8im4|&&da1((K5vKDBQ(}S~qu!5-A<4YY*s_=V$oTt{cUr$)_`dx9?3L%Y{JHH!l#2hG{$Jy-BQG62cloCizh6xM;=j_>{x4KN@aF'))  # noqa #501
-
     filepath = os.path.join(tmpdir, 'default_fbx_binary_file.fbx')
-    with open(filepath, 'wb') as f:
-        f.write(content)
+    Path(filepath).write_bytes(default_fbx_binary_content)
 
     return filepath
 
@@ -492,13 +621,13 @@ Takes:  {
 	Current: ""
 }
 """  # noqa W191
+default_fbx_ascii_content = fbx_ascii_content.encode('ascii')
 
 
 @pytest.fixture
 def default_fbx_ascii_file(tmpdir: pytest.fixture) -> str:
-    filepath = os.path.join(tmpdir, 'default_fbx_binary_file.fbx')
-    with open(filepath, 'w') as f:
-        f.write(fbx_ascii_content)
+    filepath = os.path.join(tmpdir, 'default_fbx_ascii_file.fbx')
+    Path(filepath).write_bytes(default_fbx_ascii_content)
 
     return filepath
 
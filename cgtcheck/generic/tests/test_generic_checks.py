@@ -12,27 +12,128 @@
 # details. You should have received a copy of the GNU General Public License along with this
 # program. If not, see https://www.gnu.org/licenses/.
 import os
+import re
 import sys
 import logging
-from copy import deepcopy
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
+from types import MappingProxyType
 
 import pytest
 
 import cgtcheck
 import cgtcheck.generic.all_checks
 
+from cgtcheck.generic import texture_info as texture_info_module
 from cgtcheck.generic.file_checks import CheckConsistentNaming
+from cgtcheck.generic.image_checks import _literal_prefix
 
 packages_path = Path(__file__).parent.parent.parent.parent.parent
-sys.path.append(str(packages_path / 'threed'))
+threed_path = str(packages_path / 'threed')
+if threed_path not in sys.path:
+    sys.path.append(threed_path)
 
-logging.basicConfig(format='%(levelname)s - %(name)s: %(message)s', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-checks_keys = cgtcheck.metadata.checks.keys()
-params_disabled = {'enabled': False}
-checks_spec_disabled = {key: params_disabled for key in checks_keys}
+
+@lru_cache(maxsize=None)
+def _checks_keys():
+    """
+    Returns keys of all known checks, read from metadata on first use.
+    Keys are interned, as specs built from them are looked up by literal check keys.
+    """
+    return tuple(sys.intern(key) for key in cgtcheck.metadata.checks.keys())
+
+
+@lru_cache(maxsize=None)
+def _disabled_template():
+    """
+    Returns spec entries disabling every known check, shared by all specs built from it.
+    """
+    disabled = {'enabled': False}
+    return tuple((key, disabled) for key in _checks_keys())
+
+
+def _disabled_spec():
+    """
+    Returns a fresh checks spec with every check disabled.
+    Entries of disabled checks are shared between specs and must not be modified in place.
+    """
+    return dict(_disabled_template())
+
+
+def _enable(key, params):
+    """
+    Returns a fresh checks spec with only the check of given key set up with `params`.
+    """
+    spec = _disabled_spec()
+    spec[key] = params
+    return spec
+
+
+def _tex(root, subpath):
+    """
+    Returns path of a texture under given root directory,
+    `subpath` being relative and using native separators.
+    """
+    return root + os.sep + str(subpath)
+
+
+def _with_params(checks_spec, key, params):
+    """
+    Returns a copy of spec with parameters of the check with given key updated.
+    Only the modified entry is copied, the rest is shared with `checks_spec`.
+    """
+    check_spec = dict(checks_spec[key])
+    check_spec['parameters'] = {**check_spec.get('parameters', {}), **params}
+    return {**checks_spec, key: check_spec}
+
+
+# read-only, shared by tests checking empty input; runners and collectors don't modify checks data
+_EMPTY_TEX_PATHS = MappingProxyType({'tex_paths': MappingProxyType({})})
+
+
+def _runner(checks_spec, checks_data=None):
+    """
+    Returns a new CheckRunner ready to run given spec and data.
+    """
+    return cgtcheck.runners.CheckRunner(checks_spec=checks_spec, checks_data=checks_data)
+
+
+def _props(runner, key):
+    """
+    Returns formatted properties of the check with given key.
+    """
+    return next(check for check in runner.checks if check.key == key).format_properties()
+
+
+def _run_and_assert_pass(runner):
+    """
+    Runs all checks of given runner and asserts that they passed without reports.
+    """
+    runner.runall()
+    assert runner.passed is True
+    assert runner.format_reports() == []
+
+
+def _assert_report(reports, identifier, message, item_message, items, msg_type='warning'):
+    """
+    Asserts that `reports` hold a single report of given check, with `items` given as
+    `(item, found, expected)` triples sharing the same `item_message`.
+    Identifier and type are compared first, so reports of a wrong check fail with a short diff.
+    """
+    assert len(reports) == 1
+    report = reports[0]
+    assert (report['identifier'], report['msg_type']) == (identifier, msg_type)
+    assert report == {
+        'message': message,
+        'identifier': identifier,
+        'msg_type': msg_type,
+        'items': [
+            {'message': item_message, 'item': item, 'found': found, 'expected': expected}
+            for item, found, expected in items
+        ],
+    }
 
 
 class TestApi:
@@ -48,54 +149,58 @@ class TestApi:
         assert not bool(missing_versions)
 
 
+class TestTextureInfo:
+    """
+    Tests for cached texture header reading
+    """
+
+    @pytest.mark.parametrize(
+        'textures_with_res',
+        [[(64, 32)]],
+        indirect=True,
+    )
+    def test_persistent_cache_reused(self, textures_with_res, tmpdir, monkeypatch):
+        db_path = str(tmpdir / 'cache' / 'texinfo.db')
+        monkeypatch.setenv(texture_info_module.CACHE_ENV_VAR, db_path)
+        texture_info_module._read_texture_info.cache_clear()
+
+        info = texture_info_module.texture_info(textures_with_res[0])
+        assert info == (64, 32, 'RGB', 'PNG')
+        assert os.path.exists(db_path)
+
+        texture_info_module._read_texture_info.cache_clear()
+        monkeypatch.setattr(texture_info_module.Image, 'open', None)
+        assert texture_info_module.texture_info(textures_with_res[0]) == info
+
+
 class TestCheckAspectRatio:
 
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['textureAspectRatio'] = {
+    checks_spec = _enable('textureAspectRatio', {
         'enabled': True,
         'type': 'warning'
-    }
-
-    def test_no_texture_spec_success(self):
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data={'tex_paths': {}}
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'textureAspectRatio':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
+    })
 
     def test_check_aspect_ratio_success(self, create_texture_aspect_ratio_correct):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': create_texture_aspect_ratio_correct}},
             'tex_spec': {'technical_requirements': {'aspect': 1.0}}
         }
-        runner = cgtcheck.runners.CheckRunner(checks_spec=self.checks_spec, checks_data=checks_data)
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     def test_missing_texture_file_success(self):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': 'C:/nonexistent-image.jpg'}}
         }
-        runner = cgtcheck.runners.CheckRunner(checks_spec=self.checks_spec, checks_data=checks_data)
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     def test_check_aspect_ratio_failure(self, create_texture_aspect_ratio_wrong: Path):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': str(create_texture_aspect_ratio_wrong)}},
             'tex_spec': {'technical_requirements': {'aspect': 1.0}}
         }
-        runner = cgtcheck.runners.CheckRunner(checks_spec=self.checks_spec, checks_data=checks_data)
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         reports = runner.format_reports()
@@ -110,9 +215,7 @@ class TestCheckAspectRatio:
                 'found': 2.0
             }]
         }]
-        for check in runner.checks:
-            if check.key == 'textureAspectRatio':
-                properties = check.format_properties()
+        properties = _props(runner, 'textureAspectRatio')
 
         assert properties == {
             'texture': [
@@ -125,28 +228,24 @@ class TestCheckAspectRatio:
 
 
 class TestCheckMultipleFileFormats:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['multipleFileFormats'] = {
+    checks_spec = _enable('multipleFileFormats', {
         'enabled': True,
         'type': 'warning',
-    }
+    })
 
-    def test_no_input_file_success(self):
-        checks_data = {}
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'multipleFileFormats':
-                properties = check.format_properties()
+    no_formats_checks_spec = _enable('multipleFileFormats', {
+        'enabled': True,
+        'type': 'warning',
+        'parameters': {}
+    })
 
-        assert properties == {
-            'texture': []
+    three_formats_checks_spec = _enable('multipleFileFormats', {
+        'enabled': True,
+        'type': 'warning',
+        'parameters': {
+            'formats': ['jpg', 'png', 'bmp']
         }
+    })
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
@@ -155,30 +254,20 @@ class TestCheckMultipleFileFormats:
     def test_no_file_formats_success(
         self, file_on_top_of_multiple_formats_textures_hierarchy: pytest.fixture
     ):
-        checks_spec = deepcopy(checks_spec_disabled)
-        checks_spec['multipleFileFormats'] = {
-            'enabled': True,
-            'type': 'warning',
-            'parameters': {}
-        }
         checks_data = {
             'input_file': file_on_top_of_multiple_formats_textures_hierarchy
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.no_formats_checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
         [[
-            'subdir_1' + os.sep + 'tex_1.png',
-            'subdir_2' + os.sep + 'tex_1.jpg',
+            PurePath('subdir_1', 'tex_1.png'),
+            PurePath('subdir_2', 'tex_1.jpg'),
             'tex_2.png',
-            'subdir_2' + os.sep + 'subdir_3' + os.sep + 'tex_2.jpg',
+            PurePath('subdir_2', 'subdir_3', 'tex_2.jpg'),
         ]],
         indirect=True)
     def test_multiple_formats_with_subdirectories_success(
@@ -188,12 +277,8 @@ class TestCheckMultipleFileFormats:
             'input_file': file_on_top_of_multiple_formats_textures_hierarchy
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
@@ -206,24 +291,12 @@ class TestCheckMultipleFileFormats:
     def test_3_formats_success(
         self, file_on_top_of_multiple_formats_textures_hierarchy: pytest.fixture
     ):
-        checks_spec = deepcopy(checks_spec_disabled)
-        checks_spec['multipleFileFormats'] = {
-            'enabled': True,
-            'type': 'warning',
-            'parameters': {
-                'formats': ['jpg', 'png', 'bmp']
-            }
-        }
         checks_data = {
             'input_file': file_on_top_of_multiple_formats_textures_hierarchy
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.three_formats_checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
@@ -241,9 +314,7 @@ class TestCheckMultipleFileFormats:
             'input_file': file_on_top_of_multiple_formats_textures_hierarchy
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -265,9 +336,7 @@ class TestCheckMultipleFileFormats:
                 },
             ]
         }]
-        for check in runner.checks:
-            if check.key == 'multipleFileFormats':
-                properties = check.format_properties()
+        properties = _props(runner, 'multipleFileFormats')
 
         assert properties == {
             'texture': [
@@ -288,48 +357,24 @@ class TestCheckMultipleFileFormats:
 
 
 class TestCheckIndexedColors:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['indexedColors'] = {
+    checks_spec = _enable('indexedColors', {
         'enabled': True,
         'type': 'warning',
-    }
-
-    def test_no_texture_spec_success(self):
-        checks_data = {}
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'indexedColors':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
+    })
 
     def test_indexed_colors_success(self, non_indexed_colors_image):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': non_indexed_colors_image}}
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     def test_indexed_colors_failure(self, indexed_colors_image):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': indexed_colors_image}}
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -361,9 +406,7 @@ class TestCheckIndexedColors:
             }
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -377,20 +420,16 @@ class TestCheckIndexedColors:
                 'found': True
             }]
         }]
-        for check in runner.checks:
-            if check.key == 'indexedColors':
-                properties = check.format_properties()
+        properties = _props(runner, 'indexedColors')
 
+        non_indexed = {
+            'name': 'non_indexed_colors_texture.png',
+            'mode': 'RGB'
+        }
         assert properties == {
             'texture': [
-                {
-                    'name': 'non_indexed_colors_texture.png',
-                    'mode': 'RGB'
-                },
-                {
-                    'name': 'non_indexed_colors_texture.png',
-                    'mode': 'RGB'
-                },
+                non_indexed,
+                non_indexed,
                 {
                     'name': 'indexed_colors_texture.png',
                     'mode': 'P'
@@ -400,11 +439,10 @@ class TestCheckIndexedColors:
 
 
 class TestCheckMinResolution:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['textureMinResolution'] = {
+    checks_spec = _enable('textureMinResolution', {
         'enabled': True,
         'type': 'warning',
-    }
+    })
 
     min_width = 4
     min_height = 4
@@ -417,67 +455,29 @@ class TestCheckMinResolution:
         }
     }
 
-    def test_no_tex_paths_success(self):
-        checks_data = {
-            'tex_paths': {},
-            'tex_spec': self.tex_spec,
-        }
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'textureMinResolution':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
-
-    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
-    def test_no_tex_spec_success(self, textures_with_res: pytest.fixture):
-        checks_data = {
-            'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
-            'tex_spec': {},
-        }
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-
-    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
-    def test_texture_res_within_success(self, textures_with_res: pytest.fixture):
-        checks_data = {
-            'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
-            'tex_spec': self.tex_spec,
-        }
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+    found = '{}x{}'.format(*too_low_resolution)
+    expected = '{}x{}'.format(min_width, min_height)
+    report_message = 'Texture resolution is too low'
+    item_message = 'For texture "{item}" resolution "{found}" is lower than required minimum "{expected}"'  # noqa E501
 
-    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
-    def test_texture_res_equals_limit_success(self, textures_with_res: pytest.fixture):
+    @pytest.mark.parametrize(
+        'textures_with_res, tex_spec',
+        [
+            ([ok_resolution], {}),
+            ([ok_resolution], tex_spec),
+            ([(min_width, min_height)], tex_spec),
+        ],
+        ids=['no_tex_spec', 'within_limit', 'equals_limit'],
+        indirect=['textures_with_res'],
+    )
+    def test_texture_res_success(self, textures_with_res: pytest.fixture, tex_spec: dict):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
-            'tex_spec': self.tex_spec,
+            'tex_spec': tex_spec,
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[too_low_resolution]], indirect=True)
     def test_texture_res_outside_limit_failure(self, textures_with_res: pytest.fixture):
@@ -486,26 +486,17 @@ class TestCheckMinResolution:
             'tex_spec': self.tex_spec,
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
 
-        width, height = self.too_low_resolution
-        assert runner.format_reports() == [{
-            'message': 'Texture resolution is too low',
-            'identifier': 'textureMinResolution',
-            'msg_type': 'warning',
-            'items': [{
-                'message': 'For texture "{item}" resolution "{found}" is lower than required minimum "{expected}"',  # noqa E501
-                'item': 'texture_1.png',
-                'found': '{}x{}'.format(width, height),
-                'expected': '{}x{}'.format(
-                    self.min_width, self.min_height
-                )
-            }]
-        }]
+        _assert_report(
+            runner.format_reports(),
+            identifier='textureMinResolution',
+            message=self.report_message,
+            item_message=self.item_message,
+            items=[('texture_1.png', self.found, self.expected)],
+        )
 
     @pytest.mark.parametrize(
         'textures_with_res',
@@ -513,7 +504,7 @@ class TestCheckMinResolution:
         indirect=True
     )
     def test_multiple_textures_failure(self, textures_with_res: pytest.fixture):
-        tex_1_ok, tex_2_fail, tex_3_fail = sorted(textures_with_res)
+        tex_1_ok, tex_2_fail, tex_3_fail = textures_with_res
         checks_data = {
             'tex_paths': {
                 'material_name_1': {
@@ -526,38 +517,20 @@ class TestCheckMinResolution:
             },
             'tex_spec': self.tex_spec,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
-        width, height = self.too_low_resolution
-        assert runner.format_reports() == [{
-            'message': 'Texture resolution is too low',
-            'identifier': 'textureMinResolution',
-            'msg_type': 'warning',
-            'items': [
-                {
-                    'message': 'For texture "{item}" resolution "{found}" is lower than required minimum "{expected}"',  # noqa E501
-                    'item': 'texture_2.png',
-                    'found': '{}x{}'.format(width, height),
-                    'expected': '{}x{}'.format(
-                        self.min_width, self.min_height
-                    )
-                },
-                {
-                    'message': 'For texture "{item}" resolution "{found}" is lower than required minimum "{expected}"',  # noqa E501
-                    'item': 'texture_3.png',
-                    'found': '{}x{}'.format(width, height),
-                    'expected': '{}x{}'.format(
-                        self.min_width, self.min_height
-                    )
-                }
-            ]
-        }]
-        for check in runner.checks:
-            if check.key == 'textureMinResolution':
-                properties = check.format_properties()
+        _assert_report(
+            runner.format_reports(),
+            identifier='textureMinResolution',
+            message=self.report_message,
+            item_message=self.item_message,
+            items=[
+                ('texture_2.png', self.found, self.expected),
+                ('texture_3.png', self.found, self.expected),
+            ],
+        )
+        properties = _props(runner, 'textureMinResolution')
 
         assert properties == {
             'texture': [
@@ -578,26 +551,27 @@ class TestCheckMinResolution:
 
     @pytest.mark.parametrize('textures_with_res', [[too_low_resolution]], indirect=True)
     def test_plain_texture_res_outside_limit_success(self, textures_with_res: pytest.fixture):
-        tex_spec = self.tex_spec.copy()
-        tex_spec['technical_requirements']['minSizePlain'] = [1, 1]
+        tex_spec = {
+            'technical_requirements': {
+                **self.tex_spec['technical_requirements'],
+                'minSizePlain': [1, 1],
+            }
+        }
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
             'tex_spec': tex_spec,
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is True
 
 
 class TestCheckMaxResolution:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['textureMaxResolution'] = {
+    checks_spec = _enable('textureMaxResolution', {
         'enabled': True,
         'type': 'warning',
-    }
+    })
 
     max_width = 10
     max_height = 10
@@ -610,67 +584,29 @@ class TestCheckMaxResolution:
         }
     }
 
-    def test_no_tex_paths_success(self):
-        checks_data = {
-            'tex_paths': {},
-            'tex_spec': self.tex_spec,
-        }
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'textureMaxResolution':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
-
-    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
-    def test_no_tex_spec_success(self, textures_with_res: pytest.fixture):
-        checks_data = {
-            'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
-            'tex_spec': {},
-        }
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-
-    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
-    def test_smaller_texture_success(self, textures_with_res: pytest.fixture):
-        checks_data = {
-            'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
-            'tex_spec': self.tex_spec,
-        }
-
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+    found = '{}x{}'.format(*too_high_resolution)
+    expected = '{}x{}'.format(max_width, max_height)
+    report_message = 'Texture resolution is too high'
+    item_message = 'For texture "{item}" resolution "{found}" is higher than acceptable maximum "{expected}"'  # noqa E501
 
-    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
-    def test_texture_res_equals_limit_success(self, textures_with_res: pytest.fixture):
+    @pytest.mark.parametrize(
+        'textures_with_res, tex_spec',
+        [
+            ([ok_resolution], {}),
+            ([ok_resolution], tex_spec),
+            ([(max_width, max_height)], tex_spec),
+        ],
+        ids=['no_tex_spec', 'within_limit', 'equals_limit'],
+        indirect=['textures_with_res'],
+    )
+    def test_texture_res_success(self, textures_with_res: pytest.fixture, tex_spec: dict):
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
-            'tex_spec': self.tex_spec,
+            'tex_spec': tex_spec,
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[too_high_resolution]], indirect=True)
     def test_bigger_texture_failure(self, textures_with_res: pytest.fixture):
@@ -679,26 +615,17 @@ class TestCheckMaxResolution:
             'tex_spec': self.tex_spec,
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
 
-        width, height = self.too_high_resolution
-        assert runner.format_reports() == [{
-            'message': 'Texture resolution is too high',
-            'identifier': 'textureMaxResolution',
-            'msg_type': 'warning',
-            'items': [{
-                'message': 'For texture "{item}" resolution "{found}" is higher than acceptable maximum "{expected}"',  # noqa E501
-                'item': 'texture_1.png',
-                'found': '{}x{}'.format(width, height),
-                'expected': '{}x{}'.format(
-                    self.max_width, self.max_height
-                )
-            }]
-        }]
+        _assert_report(
+            runner.format_reports(),
+            identifier='textureMaxResolution',
+            message=self.report_message,
+            item_message=self.item_message,
+            items=[('texture_1.png', self.found, self.expected)],
+        )
 
     @pytest.mark.parametrize(
         'textures_with_res',
@@ -706,7 +633,7 @@ class TestCheckMaxResolution:
         indirect=True,
     )
     def test_multiple_textures_failure(self, textures_with_res: pytest.fixture):
-        tex_1_ok, tex_2_fail, tex_3_fail = sorted(textures_with_res)
+        tex_1_ok, tex_2_fail, tex_3_fail = textures_with_res
         checks_data = {
             'tex_paths': {
                 'material_name_1': {
@@ -719,38 +646,20 @@ class TestCheckMaxResolution:
             },
             'tex_spec': self.tex_spec,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
-        width, height = self.too_high_resolution
-        assert runner.format_reports() == [{
-            'message': 'Texture resolution is too high',
-            'identifier': 'textureMaxResolution',
-            'msg_type': 'warning',
-            'items': [
-                {
-                    'message': 'For texture "{item}" resolution "{found}" is higher than acceptable maximum "{expected}"',  # noqa E501
-                    'item': 'texture_2.png',
-                    'found': '{}x{}'.format(width, height),
-                    'expected': '{}x{}'.format(
-                        self.max_width, self.max_height
-                    )
-                },
-                {
-                    'message': 'For texture "{item}" resolution "{found}" is higher than acceptable maximum "{expected}"',  # noqa E501
-                    'item': 'texture_3.png',
-                    'found': '{}x{}'.format(width, height),
-                    'expected': '{}x{}'.format(
-                        self.max_width, self.max_height
-                    )
-                }
-            ]
-        }]
-        for check in runner.checks:
-            if check.key == 'textureMaxResolution':
-                properties = check.format_properties()
+        _assert_report(
+            runner.format_reports(),
+            identifier='textureMaxResolution',
+            message=self.report_message,
+            item_message=self.item_message,
+            items=[
+                ('texture_2.png', self.found, self.expected),
+                ('texture_3.png', self.found, self.expected),
+            ],
+        )
+        properties = _props(runner, 'textureMaxResolution')
 
         assert properties == {
             'texture': [
@@ -771,33 +680,66 @@ class TestCheckMaxResolution:
 
     @pytest.mark.parametrize('textures_with_res', [[too_high_resolution]], indirect=True)
     def test_plain_texture_res_outside_limit_success(self, textures_with_res: pytest.fixture):
-        tex_spec = self.tex_spec.copy()
-        tex_spec['technical_requirements']['maxSizePlain'] = list(self.too_high_resolution)
+        tex_spec = {
+            'technical_requirements': {
+                **self.tex_spec['technical_requirements'],
+                'maxSizePlain': list(self.too_high_resolution),
+            }
+        }
         checks_data = {
             'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
             'tex_spec': tex_spec,
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is True
 
+    @pytest.mark.parametrize('textures_with_res', [[ok_resolution]], indirect=True)
+    def test_tex_spec_change_between_runs_failure(self, textures_with_res: pytest.fixture):
+        tex_spec = {
+            'technical_requirements': {
+                'maxSize': [self.max_width, self.max_height],
+            }
+        }
+        checks_data = {
+            'tex_paths': {'material_name': {'slot_type': textures_with_res[0]}},
+            'tex_spec': tex_spec,
+        }
+
+        runner = _runner(self.checks_spec, checks_data)
+        assert runner.runall() is True
+
+        tex_spec['technical_requirements']['maxSize'] = [self.ok_resolution[0] - 1] * 2
+        assert runner.runall() is False
+
 
 class TestCheckNoTexMaterial:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['texturelessMaterial'] = {
+    checks_spec = _enable('texturelessMaterial', {
         'enabled': True,
         'type': 'warning',
-    }
-    regex = r'M(?:_\w*)*_notex'
+    })
+    regex = re.compile(r'M(?:_\w*)?_notex')
     name_matching_regex_1 = 'M_some_name_notex'
     name_matching_regex_2 = 'M_other_name_notex'
     name_not_matching_regex_1 = 'some_material_name'
     name_not_matching_regex_2 = 'other_material_name'
     res = (4, 4)
 
+    @pytest.mark.parametrize(
+        'pattern, prefix',
+        [
+            (regex.pattern, 'M'),
+            (r'M_notex', 'M_notex'),
+            (r'Mat*_notex', 'Ma'),
+            (r'^M_', ''),
+            (r'(?i)M_', ''),
+            (r'M_|N_', ''),
+        ],
+    )
+    def test_literal_prefix(self, pattern: str, prefix: str):
+        assert _literal_prefix(re.compile(pattern)) == prefix
+
     @pytest.mark.parametrize('textures_with_res', [[res]], indirect=True)
     def test_without_regex_success(self, textures_with_res: pytest.fixture):
         texture_1 = textures_with_res[0]
@@ -810,15 +752,9 @@ class TestCheckNoTexMaterial:
             'tex_spec': {}
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'texturelessMaterial':
-                properties = check.format_properties()
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        properties = _props(runner, 'texturelessMaterial')
 
         assert properties == {
             'textureForMaterial': [
@@ -840,16 +776,12 @@ class TestCheckNoTexMaterial:
             }
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[res, res, res]], indirect=True)
     def test_without_no_tex_materials_success(self, textures_with_res: pytest.fixture):
-        texture_1, texture_2, texture_3 = sorted(textures_with_res)
+        texture_1, texture_2, texture_3 = textures_with_res
         checks_data = {
             'tex_paths': {
                 self.name_not_matching_regex_1: {
@@ -867,16 +799,13 @@ class TestCheckNoTexMaterial:
             }
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[res, res, res]], indirect=True)
     def test_no_tex_materials_with_textures_failure(self, textures_with_res: pytest.fixture):
-        texture_1, texture_2, texture_3 = sorted(textures_with_res)
+        texture_1, texture_2, texture_3 = textures_with_res
+        name_1, name_2, name_3 = map(os.path.basename, textures_with_res)
         checks_data = {
             'tex_paths': {
                 self.name_not_matching_regex_2: {
@@ -897,9 +826,7 @@ class TestCheckNoTexMaterial:
             }
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -910,67 +837,48 @@ class TestCheckNoTexMaterial:
                 {
                     'message': 'Material "{material}" texture "{item}"',
                     'material': self.name_matching_regex_2,
-                    'item': os.path.basename(texture_2)
+                    'item': name_2
                 },
                 {
                     'message': 'Material "{material}" texture "{item}"',
                     'material': self.name_matching_regex_1,
-                    'item': os.path.basename(texture_2)
+                    'item': name_2
                 },
                 {
                     'message': 'Material "{material}" texture "{item}"',
                     'material': self.name_matching_regex_1,
-                    'item': os.path.basename(texture_3)
+                    'item': name_3
                 },
             ]
         }]
-        for check in runner.checks:
-            if check.key == 'texturelessMaterial':
-                properties = check.format_properties()
+        properties = _props(runner, 'texturelessMaterial')
 
         assert properties == {
             'textureForMaterial': [
                 {
-                    'regexes': 'M(?:_\\w*)*_notex',
+                    'regexes': 'M(?:_\\w*)?_notex',
                     'material': self.name_matching_regex_2,
-                    'texture': [os.path.basename(texture_2)]
+                    'texture': [name_2]
                 },
                 {
-                    'regexes': 'M(?:_\\w*)*_notex',
+                    'regexes': 'M(?:_\\w*)?_notex',
                     'material': self.name_matching_regex_1,
-                    'texture': [os.path.basename(texture_2), os.path.basename(texture_3)]
+                    'texture': [name_2, name_3]
                 },
                 {
-                    'regexes': 'M(?:_\\w*)*_notex',
+                    'regexes': 'M(?:_\\w*)?_notex',
                     'material': self.name_not_matching_regex_2,
-                    'texture': [os.path.basename(texture_1)]
+                    'texture': [name_1]
                 },
             ]
         }
 
 
 class TestCheckUnsupportedPNGs:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['unsupportedPng'] = {
+    checks_spec = _enable('unsupportedPng', {
         'enabled': True,
         'type': 'warning',
-    }
-
-    def test_no_tex_paths_success(self):
-        checks_data = {'tex_paths': {}}
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'unsupportedPng':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
+    })
 
     @pytest.mark.parametrize(
         'textures_with_mode',
@@ -988,12 +896,8 @@ class TestCheckUnsupportedPNGs:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize(
         'textures_with_mode',
@@ -1017,12 +921,8 @@ class TestCheckUnsupportedPNGs:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_mode', [[('texture.png', 'LA')]], indirect=True)
     def test_unsupported_png_mode_failure(self, textures_with_mode: pytest.fixture):
@@ -1033,9 +933,7 @@ class TestCheckUnsupportedPNGs:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1067,9 +965,7 @@ class TestCheckUnsupportedPNGs:
                 },
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1089,9 +985,7 @@ class TestCheckUnsupportedPNGs:
                 }
             ]
         }]
-        for check in runner.checks:
-            if check.key == 'unsupportedPng':
-                properties = check.format_properties()
+        properties = _props(runner, 'unsupportedPng')
 
         assert properties == {
             'texture': [
@@ -1112,27 +1006,10 @@ class TestCheckUnsupportedPNGs:
 
 
 class TestCheckArithmeticJpegs:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['arithmeticJpegs'] = {
+    checks_spec = _enable('arithmeticJpegs', {
         'enabled': True,
         'type': 'warning',
-    }
-
-    def test_empty_tex_paths_success(self):
-        checks_data = {'tex_paths': {}}
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'arithmeticJpegs':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
+    })
 
     @pytest.mark.parametrize(
         'textures_with_mode',
@@ -1147,12 +1024,8 @@ class TestCheckArithmeticJpegs:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     def test_arithmetic_coded_jpg_failure(self, arithmetic_coded_jpg: pytest.fixture):
         checks_data = {
@@ -1162,9 +1035,7 @@ class TestCheckArithmeticJpegs:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1176,9 +1047,7 @@ class TestCheckArithmeticJpegs:
                 'item': 'arithmetic_coded.jpg'
             }]
         }]
-        for check in runner.checks:
-            if check.key == 'arithmeticJpegs':
-                properties = check.format_properties()
+        properties = _props(runner, 'arithmeticJpegs')
 
         assert properties == {
             'texture': [
@@ -1191,33 +1060,56 @@ class TestCheckArithmeticJpegs:
 
 
 class TestCheckOrmConsistentResolution:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['resolutionOrmMismatch'] = {
+    checks_spec = _enable('resolutionOrmMismatch', {
         'enabled': True,
         'type': 'warning',
-    }
+    })
     res = (6, 6)
     other_res = (8, 8)
     yet_another_res = (10, 10)
     slot_to_check_1 = 'occlusion'
     slot_to_check_2 = 'roughness'
     slot_to_check_3 = 'metallic'
-
-    def test_empty_tex_paths_success(self):
-        checks_data = {'tex_paths': {}}
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'resolutionOrmMismatch':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
+    first_material_only_properties = {
+        'texture': [
+            {
+                'material': 'material_name_1',
+                'type': 'metallic',
+                'name': 'texture_3.png',
+                'resolution': [8, 8]
+            },
+            {
+                'material': 'material_name_1',
+                'type': 'occlusion',
+                'name': 'texture_1.png',
+                'resolution': [6, 6]
+            },
+            {
+                'material': 'material_name_1',
+                'type': 'roughness',
+                'name': 'texture_2.png',
+                'resolution': [6, 6]
+            },
+            {
+                'material': 'material_name_2',
+                'type': 'metallic',
+                'name': 'texture_4.png',
+                'resolution': [10, 10]
+            },
+            {
+                'material': 'material_name_2',
+                'type': 'occlusion',
+                'name': 'texture_1.png',
+                'resolution': [6, 6]
+            },
+            {
+                'material': 'material_name_2',
+                'type': 'roughness',
+                'name': 'texture_3.png',
+                'resolution': [8, 8]
+            }
+        ]
+    }
 
     @pytest.mark.parametrize('textures_with_res', [[res, res, res]], indirect=True)
     def test_orm_same_resolution_success(self, textures_with_res: pytest.fixture):
@@ -1232,12 +1124,8 @@ class TestCheckOrmConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[res, res, res, other_res]], indirect=True)
     def test_non_orm_textures_diffrent_resolution_success(self, textures_with_res: pytest.fixture):
@@ -1253,12 +1141,8 @@ class TestCheckOrmConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[res, res, other_res]], indirect=True)
     def test_orm_different_resolutions_failure(self, textures_with_res: pytest.fixture):
@@ -1273,9 +1157,7 @@ class TestCheckOrmConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1322,9 +1204,7 @@ class TestCheckOrmConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1349,79 +1229,49 @@ class TestCheckOrmConsistentResolution:
                 }
             ]
         }]
-        for check in runner.checks:
-            if check.key == 'resolutionOrmMismatch':
-                properties = check.format_properties()
+        properties = _props(runner, 'resolutionOrmMismatch')
 
-        assert properties == {
-            'texture': [
-                {
-                    'material': 'material_name_1',
-                    'type': 'metallic',
-                    'name': 'texture_3.png',
-                    'resolution': [8, 8]
-                },
-                {
-                    'material': 'material_name_1',
-                    'type': 'occlusion',
-                    'name': 'texture_1.png',
-                    'resolution': [6, 6]
-                },
-                {
-                    'material': 'material_name_1',
-                    'type': 'roughness',
-                    'name': 'texture_2.png',
-                    'resolution': [6, 6]
-                },
-                {
-                    'material': 'material_name_2',
-                    'type': 'metallic',
-                    'name': 'texture_4.png',
-                    'resolution': [10, 10]
-                },
-                {
-                    'material': 'material_name_2',
-                    'type': 'occlusion',
-                    'name': 'texture_1.png',
-                    'resolution': [6, 6]
-                },
-                {
-                    'material': 'material_name_2',
-                    'type': 'roughness',
-                    'name': 'texture_3.png',
-                    'resolution': [8, 8]
-                }
-            ]
-        }
+        assert properties == self.first_material_only_properties
 
 
 class TestCheckColorOpacityConsistentResolution:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['resolutionsColorOpacityMismatch'] = {
+    checks_spec = _enable('resolutionsColorOpacityMismatch', {
         'enabled': True,
         'type': 'warning',
-    }
+    })
     res = (6, 6)
     other_res = (8, 8)
     yet_another_res = (10, 10)
     slot_to_check_1 = 'color'
     slot_to_check_2 = 'opacity'
-
-    def test_empty_tex_paths_success(self):
-        checks_data = {'tex_paths': {}}
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'resolutionsColorOpacityMismatch':
-                properties = check.format_properties()
-
-        assert properties == {
-            'texture': []
-        }
+    first_material_only_properties = {
+        'texture': [
+            {
+                'material': 'material_name_1',
+                'type': 'color',
+                'name': 'texture_1.png',
+                'resolution': [6, 6]
+            },
+            {
+                'material': 'material_name_1',
+                'type': 'opacity',
+                'name': 'texture_2.png',
+                'resolution': [8, 8]
+            },
+            {
+                'material': 'material_name_2',
+                'type': 'color',
+                'name': 'texture_1.png',
+                'resolution': [6, 6]
+            },
+            {
+                'material': 'material_name_2',
+                'type': 'opacity',
+                'name': 'texture_3.png',
+                'resolution': [10, 10]
+            }
+        ]
+    }
 
     @pytest.mark.parametrize('textures_with_res', [[res, res]], indirect=True)
     def test_orm_same_resolution_success(self, textures_with_res: pytest.fixture):
@@ -1435,12 +1285,8 @@ class TestCheckColorOpacityConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[res, res, other_res]], indirect=True)
     def test_non_orm_textures_diffrent_resolution_success(self, textures_with_res: pytest.fixture):
@@ -1455,12 +1301,8 @@ class TestCheckColorOpacityConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize('textures_with_res', [[res, other_res]], indirect=True)
     def test_orm_different_resolutions_failure(self, textures_with_res: pytest.fixture):
@@ -1474,9 +1316,7 @@ class TestCheckColorOpacityConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1517,9 +1357,7 @@ class TestCheckColorOpacityConsistentResolution:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1540,62 +1378,16 @@ class TestCheckColorOpacityConsistentResolution:
                 }
             ]
         }]
-        for check in runner.checks:
-            if check.key == 'resolutionsColorOpacityMismatch':
-                properties = check.format_properties()
+        properties = _props(runner, 'resolutionsColorOpacityMismatch')
 
-        assert properties == {
-            'texture': [
-                {
-                    'material': 'material_name_1',
-                    'type': 'color',
-                    'name': 'texture_1.png',
-                    'resolution': [6, 6]
-                },
-                {
-                    'material': 'material_name_1',
-                    'type': 'opacity',
-                    'name': 'texture_2.png',
-                    'resolution': [8, 8]
-                },
-                {
-                    'material': 'material_name_2',
-                    'type': 'color',
-                    'name': 'texture_1.png',
-                    'resolution': [6, 6]
-                },
-                {
-                    'material': 'material_name_2',
-                    'type': 'opacity',
-                    'name': 'texture_3.png',
-                    'resolution': [10, 10]
-                }
-            ]
-        }
+        assert properties == self.first_material_only_properties
 
 
 class TestCheckUnsupportedBmpCompression:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['unsupportedBmpCompression'] = {
+    checks_spec = _enable('unsupportedBmpCompression', {
         'enabled': True,
         'type': 'warning',
-    }
-
-    def test_empty_tex_paths_success(self):
-        checks_data = {'tex_paths': {}}
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'unsupportedBmpCompression':
-                properties = check.format_properties()
-
-        assert properties == {
-            'textures': []
-        }
+    })
 
     @pytest.mark.parametrize(
         'textures_with_mode',
@@ -1617,15 +1409,9 @@ class TestCheckUnsupportedBmpCompression:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'unsupportedBmpCompression':
-                properties = check.format_properties()
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        properties = _props(runner, 'unsupportedBmpCompression')
 
         assert properties == {
             'textures': [
@@ -1655,9 +1441,7 @@ class TestCheckUnsupportedBmpCompression:
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1671,17 +1455,57 @@ class TestCheckUnsupportedBmpCompression:
         }]
 
 
+class TestEmptyInput:
+    """
+    Tests for checks given nothing to check
+    """
+
+    @pytest.mark.parametrize(
+        'check_key, checks_data, properties_key',
+        [
+            ('textureAspectRatio', _EMPTY_TEX_PATHS, 'texture'),
+            ('multipleFileFormats', {}, 'texture'),
+            ('indexedColors', {}, 'texture'),
+            (
+                'textureMinResolution',
+                {'tex_paths': {}, 'tex_spec': {'technical_requirements': {'minSize': [4, 4]}}},
+                'texture',
+            ),
+            (
+                'textureMaxResolution',
+                {'tex_paths': {}, 'tex_spec': {'technical_requirements': {'maxSize': [10, 10]}}},
+                'texture',
+            ),
+            ('unsupportedPng', _EMPTY_TEX_PATHS, 'texture'),
+            ('arithmeticJpegs', _EMPTY_TEX_PATHS, 'texture'),
+            ('resolutionOrmMismatch', _EMPTY_TEX_PATHS, 'texture'),
+            ('resolutionsColorOpacityMismatch', _EMPTY_TEX_PATHS, 'texture'),
+            ('unsupportedBmpCompression', _EMPTY_TEX_PATHS, 'textures'),
+        ],
+    )
+    def test_empty_input_success(self, check_key, checks_data, properties_key):
+        checks_spec = _enable(check_key, {
+            'enabled': True,
+            'type': 'warning',
+        })
+        runner = _runner(checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+
+        assert _props(runner, check_key) == {
+            properties_key: []
+        }
+
+
 class TestCheckUnusedTextures:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['unusedTextures'] = {
+    checks_spec = _enable('unusedTextures', {
         'enabled': True,
         'type': 'warning',
-    }
-    texture_subpath_1 = 'subdir_1' + os.sep + 'tex_1.png'
-    texture_subpath_2 = 'subdir_2' + os.sep + 'tex_2.jpg'
-    texture_subpath_3 = 'tex_3.png'
-    texture_subpath_4 = 'subdir_2' + os.sep + 'subdir_3' + os.sep + 'tex_4.jpg'
-    texture_subpath_5_gif = 'tex_5.gif'
+    })
+    texture_subpath_1 = PurePath('subdir_1', 'tex_1.png')
+    texture_subpath_2 = PurePath('subdir_2', 'tex_2.jpg')
+    texture_subpath_3 = PurePath('tex_3.png')
+    texture_subpath_4 = PurePath('subdir_2', 'subdir_3', 'tex_4.jpg')
+    texture_subpath_5_gif = PurePath('tex_5.gif')
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
@@ -1694,19 +1518,13 @@ class TestCheckUnusedTextures:
         checks_data = {
             'tex_paths': {
                 'material_name_1': {
-                    'slot_type_1': os.path.join(root, self.texture_subpath_1),
+                    'slot_type_1': _tex(root, self.texture_subpath_1),
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'unusedTextures':
-                properties = check.format_properties()
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        properties = _props(runner, 'unusedTextures')
 
         assert properties == {
             'textures': []
@@ -1731,21 +1549,17 @@ class TestCheckUnusedTextures:
             'input_file': input_file,
             'tex_paths': {
                 'material_name_1': {
-                    'slot_type_1': os.path.join(root, self.texture_subpath_1),
-                    'slot_type_2': os.path.join(root, self.texture_subpath_2),
+                    'slot_type_1': _tex(root, self.texture_subpath_1),
+                    'slot_type_2': _tex(root, self.texture_subpath_2),
                 },
                 'material_name_2': {
-                    'slot_type_1': os.path.join(root, self.texture_subpath_3),
-                    'slot_type_2': os.path.join(root, self.texture_subpath_4),
+                    'slot_type_1': _tex(root, self.texture_subpath_3),
+                    'slot_type_2': _tex(root, self.texture_subpath_4),
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
@@ -1765,16 +1579,12 @@ class TestCheckUnusedTextures:
             'input_file': input_file,
             'tex_paths': {
                 'material_name_1': {
-                    'slot_type_1': os.path.join(root, self.texture_subpath_1),
+                    'slot_type_1': _tex(root, self.texture_subpath_1),
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
 
     @pytest.mark.parametrize(
         'file_on_top_of_multiple_formats_textures_hierarchy',
@@ -1787,27 +1597,24 @@ class TestCheckUnusedTextures:
         self,
         file_on_top_of_multiple_formats_textures_hierarchy: pytest.fixture,
     ):
-        checks_spec = deepcopy(checks_spec_disabled)
-        checks_spec['unusedTextures'] = {
+        checks_spec = _enable('unusedTextures', {
             'enabled': True,
             'type': 'warning',
             'parameters': {
                 'formats': ['gif']
             }
-        }
+        })
         input_file = file_on_top_of_multiple_formats_textures_hierarchy
         root = os.path.dirname(input_file)
         checks_data = {
             'input_file': input_file,
             'tex_paths': {
                 'material_name_1': {
-                    'slot_type_1': os.path.join(root, self.texture_subpath_1),
+                    'slot_type_1': _tex(root, self.texture_subpath_1),
                 },
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=checks_spec, checks_data=checks_data
-        )
+        runner = _runner(checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1839,16 +1646,14 @@ class TestCheckUnusedTextures:
             'input_file': input_file,
             'tex_paths': {
                 'material_name_1': {
-                    'slot_type_1': os.path.join(root, self.texture_subpath_1),
+                    'slot_type_1': _tex(root, self.texture_subpath_1),
                 },
                 'material_name_2': {
-                    'slot_type_2': os.path.join(root, self.texture_subpath_4),
+                    'slot_type_2': _tex(root, self.texture_subpath_4),
                 }
             }
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -1866,9 +1671,7 @@ class TestCheckUnusedTextures:
                 }
             ]
         }]
-        for check in runner.checks:
-            if check.key == 'unusedTextures':
-                properties = check.format_properties()
+        properties = _props(runner, 'unusedTextures')
 
         assert properties == {
             'textures': [
@@ -1893,8 +1696,7 @@ class TestCheckUnusedTextures:
 
 
 class TestTextureAlphaChannel:
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec['textureAlphaChannel'] = {
+    checks_spec = _enable('textureAlphaChannel', {
         'enabled': True,
         'type': 'warning',
         'parameters': {
@@ -1906,7 +1708,7 @@ class TestTextureAlphaChannel:
             'normal': True,
             'emission': True
         }
-    }
+    })
 
     @pytest.mark.parametrize(
         'textures_with_mode',
@@ -1940,16 +1742,9 @@ class TestTextureAlphaChannel:
             }
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec,
-            checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'textureAlphaChannel':
-                properties = check.format_properties()
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        properties = _props(runner, 'textureAlphaChannel')
         assert properties == {
             'textures': [
                 {'name': 'M_0_0_tmp_0_BaseColor.png', 'mode': 'RGB'},
@@ -1994,10 +1789,7 @@ class TestTextureAlphaChannel:
             }
         }
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec,
-            checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [
@@ -2017,9 +1809,7 @@ class TestTextureAlphaChannel:
                 ]
             }
         ]
-        for check in runner.checks:
-            if check.key == 'textureAlphaChannel':
-                properties = check.format_properties()
+        properties = _props(runner, 'textureAlphaChannel')
         assert properties == {
             'textures': [
                 {'name': 'M_0_0_tmp_0_BaseColor.png', 'mode': 'RGB'},
@@ -2057,19 +1847,11 @@ class TestTextureAlphaChannel:
                 }
             }
         }
-        checks_spec = deepcopy(self.checks_spec)
-        checks_spec['textureAlphaChannel']['parameters'].update({'normal': False})
+        checks_spec = _with_params(self.checks_spec, 'textureAlphaChannel', {'normal': False})
 
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=checks_spec,
-            checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == 'textureAlphaChannel':
-                properties = check.format_properties()
+        runner = _runner(checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        properties = _props(runner, 'textureAlphaChannel')
         assert properties == {
             'textures': [
                 {'name': 'M_0_0_tmp_0_BaseColor.png', 'mode': 'RGB'},
@@ -2082,8 +1864,7 @@ class TestTextureAlphaChannel:
 
 class TestCheckFbxFormat:
     check_key = 'fbxFormat'
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec[check_key] = {
+    checks_spec = _enable(check_key, {
         'enabled': True,
         'type': 'warning',
         'parameters': {
@@ -2091,7 +1872,7 @@ class TestCheckFbxFormat:
             'allow_ascii': False,
             'version': {'min': 7100, 'max': None},
         },
-    }
+    })
 
     def test_binary_file_within_version_limits_passes(
         self,
@@ -2100,33 +1881,22 @@ class TestCheckFbxFormat:
         checks_data = {
             'input_file': default_fbx_binary_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec,
-            checks_data=checks_data,
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        for check in runner.checks:
-            if check.key == self.check_key:
-                properties = check.format_properties()
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        properties = _props(runner, self.check_key)
         assert properties == {'type': 'binary', 'version': 7400}
 
     def test_binary_file_below_version_limits_fails(
         self,
         default_fbx_binary_file: pytest.fixture
     ):
-        checks_spec = deepcopy(self.checks_spec)
-        checks_spec[self.check_key]['parameters'].update({
+        checks_spec = _with_params(self.checks_spec, self.check_key, {
             'version': {'min': 9999, 'max': None},
         })
         checks_data = {
             'input_file': default_fbx_binary_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=checks_spec,
-            checks_data=checks_data,
-        )
+        runner = _runner(checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2145,26 +1915,20 @@ class TestCheckFbxFormat:
                 'found_version': 7400,
             }]
         }]
-        for check in runner.checks:
-            if check.key == self.check_key:
-                properties = check.format_properties()
+        properties = _props(runner, self.check_key)
         assert properties == {'type': 'binary', 'version': 7400}
 
     def test_binary_file_above_version_limits_fails(
         self,
         default_fbx_binary_file: pytest.fixture
     ):
-        checks_spec = deepcopy(self.checks_spec)
-        checks_spec[self.check_key]['parameters'].update({
+        checks_spec = _with_params(self.checks_spec, self.check_key, {
             'version': {'min': None, 'max': 6100},
         })
         checks_data = {
             'input_file': default_fbx_binary_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=checks_spec,
-            checks_data=checks_data,
-        )
+        runner = _runner(checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2183,9 +1947,7 @@ class TestCheckFbxFormat:
                 'found_version': 7400,
             }]
         }]
-        for check in runner.checks:
-            if check.key == self.check_key:
-                properties = check.format_properties()
+        properties = _props(runner, self.check_key)
         assert properties == {'type': 'binary', 'version': 7400}
 
     def test_ascii_file_fails_type_check(
@@ -2195,10 +1957,7 @@ class TestCheckFbxFormat:
         checks_data = {
             'input_file': default_fbx_ascii_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec,
-            checks_data=checks_data,
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2217,19 +1976,16 @@ class TestCheckFbxFormat:
                 'found_version': 7700,
             }]
         }]
-        for check in runner.checks:
-            if check.key == self.check_key:
-                properties = check.format_properties()
+        properties = _props(runner, self.check_key)
         assert properties == {'type': 'ASCII', 'version': 7700}
 
 
 class TestRecommendedTexturesNaming:
     _check_key = 'recommendedTexturesNaming'
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec[_check_key] = {
+    checks_spec = _enable(_check_key, {
         'enabled': True,
         'type': 'error',
-    }
+    })
     slot_to_check_1 = 'opacity'
     slot_to_check_2 = 'roughness'
     slot_to_check_3 = 'metallic'
@@ -2271,14 +2027,9 @@ class TestRecommendedTexturesNaming:
             },
             'input_file': default_fbx_ascii_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        this_check = next(check for check in runner.checks if check.key == self._check_key)
-        assert this_check.format_properties() == {
+        runner = _runner(self.checks_spec, checks_data)
+        _run_and_assert_pass(runner)
+        assert _props(runner, self._check_key) == {
             'texture': [
                 {
                     'name': 'M_2_3_BaseColor.png',
@@ -2345,9 +2096,7 @@ class TestRecommendedTexturesNaming:
             },
             'input_file': default_fbx_ascii_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2374,8 +2123,7 @@ class TestRecommendedTexturesNaming:
                 }
             ]
         }]
-        this_check = next(check for check in runner.checks if check.key == self._check_key)
-        assert this_check.format_properties() == {
+        assert _props(runner, self._check_key) == {
             'texture': [
                 {
                     'name': 'M_2_3_AO.png',
@@ -2438,9 +2186,7 @@ class TestRecommendedTexturesNaming:
             },
             'input_file': default_fbx_ascii_file,
         }
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec, checks_data=checks_data
-        )
+        runner = _runner(self.checks_spec, checks_data)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2467,14 +2213,14 @@ class TestRecommendedTexturesNaming:
                     'message': 'Found {found}: {item}',
                     'found': 'incorrect extension',
                     'item': [
-                        'default_fbx_binary_file.fbx'
+                        'default_fbx_ascii_file.fbx'
                     ]
                 },
                 {
                     'message': 'Found {found}: {item}',
                     'found': 'incorrect texture name connected to material M_5_123',
                     'item': [
-                        'default_fbx_binary_file.fbx'
+                        'default_fbx_ascii_file.fbx'
                     ]
                 },
                 {
@@ -2493,8 +2239,7 @@ class TestRecommendedTexturesNaming:
                 }
             ]
         }]
-        this_check = next(check for check in runner.checks if check.key == self._check_key)
-        assert this_check.format_properties() == {
+        assert _props(runner, self._check_key) == {
             'texture': [
                 {
                     'name': 'M_2_3_AO.png',
@@ -2526,11 +2271,10 @@ class TestRecommendedTexturesNaming:
 
 class TestConsistentNaming:
     _check_key = 'consistentNaming'
-    checks_spec = deepcopy(checks_spec_disabled)
-    checks_spec[_check_key] = {
+    checks_spec = _enable(_check_key, {
         'enabled': True,
         'type': 'error',
-    }
+    })
 
     @pytest.mark.parametrize(
         'expected_ending_type, expected_ending, names',
@@ -2573,14 +2317,9 @@ class TestConsistentNaming:
         self,
         call_fixture_scene_with_named_entities,
     ):
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec
-        )
-        runner.runall()
-        assert runner.passed is True
-        assert runner.format_reports() == []
-        this_check = next(check for check in runner.checks if check.key == self._check_key)
-        assert this_check.format_properties() == {
+        runner = _runner(self.checks_spec)
+        _run_and_assert_pass(runner)
+        assert _props(runner, self._check_key) == {
             'names': [
                 {
                     'id': 0,
@@ -2633,9 +2372,7 @@ class TestConsistentNaming:
         self,
         call_fixture_scene_with_named_entities,
     ):
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec
-        )
+        runner = _runner(self.checks_spec)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2660,8 +2397,7 @@ class TestConsistentNaming:
                 }
             ]
         }]
-        this_check = next(check for check in runner.checks if check.key == self._check_key)
-        assert this_check.format_properties() == {
+        assert _props(runner, self._check_key) == {
             'names': [
                 {
                     'id': 0,
@@ -2709,9 +2445,7 @@ class TestConsistentNaming:
         self,
         call_fixture_scene_with_named_entities,
     ):
-        runner = cgtcheck.runners.CheckRunner(
-            checks_spec=self.checks_spec
-        )
+        runner = _runner(self.checks_spec)
         runner.runall()
         assert runner.passed is False
         assert runner.format_reports() == [{
@@ -2733,8 +2467,7 @@ class TestConsistentNaming:
                 }
             ]
         }]
-        this_check = next(check for check in runner.checks if check.key == self._check_key)
-        assert this_check.format_properties() == {
+        assert _props(runner, self._check_key) == {
             'names': [
                 {
                     'id': 0,
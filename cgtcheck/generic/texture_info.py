@@ -0,0 +1,136 @@
+# This code is provided to you by UAB CGTrader, code 302935696, address - Antakalnio str. 17,
+# Vilnius, Lithuania, the company registered with the Register of Legal Entities of the Republic
+# of Lithuania (CGTrader).
+#
+# Copyright (C) 2022  CGTrader.
+#
+# This program is provided to you as free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version. It is distributed in the hope
+# that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details. You should have received a copy of the GNU General Public License along with this
+# program. If not, see https://www.gnu.org/licenses/.
+
+
+"""
+Cached texture header information shared by the image checks.
+
+Headers are memoized in-process by `(path, mtime, size)`. Setting the `CGTCHECK_TEXINFO_CACHE`
+environment variable to a file path additionally persists them in an sqlite database,
+so repeated runs over unchanged textures don't need to open them at all.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from PIL import Image
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV_VAR = 'CGTCHECK_TEXINFO_CACHE'
+
+
+class TextureInfo(NamedTuple):
+    """
+    Texture header information, read without decoding pixel data.
+    """
+
+    width: int
+    height: int
+    mode: str
+    format: Optional[str]
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    @property
+    def has_palette(self) -> bool:
+        return self.mode in ('P', 'PA')
+
+
+class _PersistentCache:
+    """
+    Sqlite backed `(path, mtime, size) -> TextureInfo` store.
+    """
+
+    _schema = (
+        'CREATE TABLE IF NOT EXISTS texinfo ('
+        'path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, '
+        'width INTEGER, height INTEGER, mode TEXT, format TEXT)'
+    )
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(self._schema)
+        self._conn.commit()
+
+    def get(self, path: str, mtime: int, size: int) -> Optional[TextureInfo]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT width, height, mode, format FROM texinfo '
+                'WHERE path = ? AND mtime = ? AND size = ?',
+                (path, mtime, size)
+            ).fetchone()
+        return TextureInfo(*row) if row else None
+
+    def put(self, path: str, mtime: int, size: int, info: TextureInfo) -> None:
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO texinfo VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (path, mtime, size) + tuple(info)
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=None)
+def _persistent_cache(db_path: str) -> Optional[_PersistentCache]:
+    try:
+        return _PersistentCache(db_path)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning('Texture info cache disabled, cannot open %s: %s', db_path, exc)
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _read_texture_info(path: str, mtime: int, size: int) -> TextureInfo:
+    db_path = os.environ.get(CACHE_ENV_VAR)
+    cache = _persistent_cache(db_path) if db_path else None
+    if cache is not None:
+        info = cache.get(path, mtime, size)
+        if info is not None:
+            return info
+
+    with Image.open(path) as img:
+        info = TextureInfo(img.width, img.height, img.mode, img.format)
+
+    if cache is not None:
+        try:
+            cache.put(path, mtime, size, info)
+        except sqlite3.Error as exc:
+            logger.warning('Failed to store texture info for %s: %s', path, exc)
+    return info
+
+
+def texture_info(path: Union[str, Path]) -> TextureInfo:
+    """
+    Return header information of a texture, reusing cached results while file
+    modification time and size are unchanged.
+    """
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    return _read_texture_info(path, stat.st_mtime_ns, stat.st_size)
@@ -29,10 +29,16 @@ from cgtcheck.common import Check
 
 logger = logging.getLogger(__name__)
 
+CheckProps = namedtuple('CheckData', 'check properties')  # type: tuple[Check, dict]
+
+
+_UNDETECTED = object()
+
 
 class CheckRunner(object):
 
     _check_classes = []  # type: list[type[Check]]
+    _detected_dcc = _UNDETECTED  # type: str|None|object
 
     def __init__(self, checks_spec, checks_data=None, dcc=None):
         # type: (dict, dict|None, str|None) -> None
@@ -63,20 +69,25 @@ class CheckRunner(object):
             ) for cls in self._check_classes
         ]  # type: list[Check]
         self.passed = None  # type: bool|None
+        self._failed_checks = None  # type: list[Check]|None
 
-    @staticmethod
-    def _detect_dcc():
+    @classmethod
+    def _detect_dcc(cls):
         # type: () -> str | None
         """
         Makes an informed guess about which DCC application it's running in.
+        The application doesn't change during the process, so it's only detected once.
 
         Returns:
             'Blender'
             None
         """
-        if os.path.basename(sys.argv[0]).lower() in ('blender', 'blender.exe'):
-            return 'Blender'
-        return None
+        if cls._detected_dcc is _UNDETECTED:
+            if os.path.basename(sys.argv[0]).lower() in ('blender', 'blender.exe'):
+                CheckRunner._detected_dcc = 'Blender'
+            else:
+                CheckRunner._detected_dcc = None
+        return cls._detected_dcc
 
     @staticmethod
     def get_collector(dcc, tex_paths=None, input_file=None, tex_spec=None, uid=None):
@@ -173,13 +184,14 @@ class CheckRunner(object):
         Runs all checks and returns True if all pass, or False if any fail.
         Updates self.passed value in addition.
         """
+        self._failed_checks = None  # until the run completes, failures are computed live
         self.collector.collect()
 
         for chk in self.checks:
             if chk.is_enabled():
                 chk.run()
 
-        self.passed = all(chk.passed for chk in self.checks)
+        self._classify()
         return self.passed
 
     def run_all_report_per_check(self, selection_only=False):
@@ -191,6 +203,7 @@ class CheckRunner(object):
         In addition updates self.passed value to False if any run check fails, True otherwise
             (e.g. no check executed, all checks pass).
         """
+        self._failed_checks = None  # until the run completes, failures are computed live
         self.collector.collect(selection_only)
 
         for chk in self.checks:
@@ -200,10 +213,29 @@ class CheckRunner(object):
                 report['passed'] = chk.passed
                 yield report
 
-        self.passed = all(chk.passed for chk in self.checks)
+        self._classify()
+
+    def _classify(self):
+        # type: () -> None
+        """
+        Updates self.passed and remembers failed checks after a run,
+        so reporting methods only go through those.
+        """
+        self._failed_checks = [chk for chk in self.checks if not chk.passed]
+        self.passed = not self._failed_checks
+
+    def failed_checks(self):
+        # type: () -> list[Check]
+        """
+        Returns checks which failed, as of the last run.
+        """
+        if self._failed_checks is None:  # checks weren't run through this runner
+            return [chk for chk in self.checks if not chk.passed]
+        return self._failed_checks
 
     def reset(self):
         self.passed = None
+        self._failed_checks = None
         for chk in self.checks:
             chk.reset()
 
@@ -222,16 +254,13 @@ class CheckRunner(object):
         """
         Returns True if any checks were failed with an error
         """
-        return any(
-            chk.passed is False for chk in self.checks
-            if chk.report_type == 'error'
-        )
+        return any(chk.report_type == 'error' for chk in self.failed_checks())
 
     def error_messages(self):
         # type: () -> list[str]
         return [
-            chk.fail_message() for chk in self.checks
-            if (not chk.passed) and chk.report_type == 'error'
+            chk.fail_message() for chk in self.failed_checks()
+            if chk.report_type == 'error'
         ]
 
     def error_message(self):
@@ -241,8 +270,8 @@ class CheckRunner(object):
     def warning_messages(self):
         # type: () -> list[str]
         return [
-            chk.fail_message() for chk in self.checks
-            if (not chk.passed) and chk.report_type == 'warning'
+            chk.fail_message() for chk in self.failed_checks()
+            if chk.report_type == 'warning'
         ]
 
     def warning_message(self):
@@ -259,8 +288,8 @@ class CheckRunner(object):
             msg_type: type of failures to format: 'warning'/'error', will include both if None
         """
         return [
-            chk.format_report() for chk in self.checks
-            if not chk.passed and chk.is_enabled()
+            chk.format_report() for chk in self.failed_checks()
+            if chk.is_enabled()
             and chk.report_type != 'details' and msg_type in (None, chk.report_type)
         ]
 
@@ -293,7 +322,6 @@ class CheckRunner(object):
         objs = [{'name': obj.name} for obj in self.collector.objects]
         materials = [{'name': mtl.name} for mtl in self.collector.materials]
 
-        CheckProps = namedtuple('CheckData', 'check properties')  # type: tuple[Check, dict]
         checks_properties = (
             CheckProps(chk, chk.format_properties()) for chk in self.checks if chk.is_enabled()
         )
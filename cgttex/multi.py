@@ -16,13 +16,10 @@
 """
 Classes which allow matching by multiple patterns.
 May be very closely coupled with patterns.TexPatterns.
-
-This module does not support Python2
 """
 
 import os
-from copy import copy
-from typing import Dict, List, Set
+from typing import Dict, List, Pattern, Sequence, Set, Tuple
 
 import cgttex.patterns
 
@@ -34,18 +31,26 @@ class MultiTexPatterns:
     """
 
     def __init__(self, patterns: Dict[str, Dict]):
-        patterns_adapted = {}
-        for key in patterns:
-            pattern = patterns_adapted[key] = copy(patterns[key])
-            pattern['input_directories'] = ['\\.+']  # does not support filtering dir names
-            pattern.setdefault('output_files', {})
-            pattern.setdefault('parsed_variables', {})
-            pattern.setdefault('predefined_variables', {})
+        patterns_adapted = {
+            key: {
+                'output_files': {},
+                'parsed_variables': {},
+                'predefined_variables': {},
+                **pattern,
+                'input_directories': ['\\.+'],  # does not support filtering dir names
+            }
+            for key, pattern in patterns.items()
+        }
 
+        # raw patterns still hold placeholders, they get compiled once substituted
         self.runners = {
-            key: cgttex.patterns.TexPatterns(pattern=pattern)
+            key: cgttex.patterns.TexPatterns(pattern=pattern, compile=False)
             for key, pattern in patterns_adapted.items()
         }
+        # substituted and compiled 'input_files' regexes, by pattern name and substitution sources
+        self._compiled_cache: Dict[Tuple, Dict[str, Pattern]] = {}
+        # file names to paths by searched directory, one walk per directory for instance lifetime
+        self._files_cache: Dict[str, Tuple[Tuple[str, str], ...]] = {}
 
     def all_matches(
         self,
@@ -70,16 +75,12 @@ class MultiTexPatterns:
             parse_sources = {}
         base_dir = os.path.dirname(infile)
 
-        all_files = {
-            f: os.path.join(dir, f)
-            for dir, _dirs, files in os.walk(base_dir)
-            for f in files
-        }
+        all_files = self.list_files(base_dir)
         matches_by_pattern = {
-            pattern_name: self.matches_for_runner(
-                runner, infile, all_files, parse_sources=parse_sources
+            pattern_name: self.match_files(
+                self.input_files_regexes(pattern_name, infile, parse_sources), all_files
             ).keys()
-            for pattern_name, runner in self.runners.items()
+            for pattern_name in self.runners
         }
         matches_by_type: Dict[str, Set[str]] = {}
         for pattern_name, matches in matches_by_pattern.items():
@@ -89,6 +90,69 @@ class MultiTexPatterns:
             asset_type: sorted(patterns) for asset_type, patterns in matches_by_type.items()
         }
 
+    def list_files(self, base_dir: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Returns (file name, path) pairs of all files in the tree of given directory,
+        with a single pair per file name (last one found).
+        The tree is walked once, later calls reuse the result.
+        """
+        files = self._files_cache.get(base_dir)
+        if files is None:
+            files = self._files_cache[base_dir] = tuple(
+                dict(cgttex.patterns.walk_files(base_dir)).items()
+            )
+        return files
+
+    def input_files_regexes(
+        self,
+        pattern_name: str,
+        infile: str,
+        parse_sources: Dict[str, str],
+    ) -> Dict[str, Pattern]:
+        """
+        Returns compiled 'input_files' regexes of given pattern, substituted for given sources.
+        Substitutions only depend on the input filename and parse sources,
+        so those are compiled once and reused on later calls.
+
+        Return:
+            Dict[type, compiled regex]
+        """
+        key = (pattern_name, os.path.basename(infile), frozenset(parse_sources.items()))
+        regexes = self._compiled_cache.get(key)
+        if regexes is None:
+            runner = self.runners[pattern_name]
+            runner.reset_substitutions()
+            runner.substitute(infile=infile, **parse_sources)
+            runner.compile()
+            regexes = self._compiled_cache[key] = {
+                asset_type: entry.compiled for asset_type, entry in runner.input_files.items()
+            }
+        return regexes
+
+    @staticmethod
+    def match_files(
+        regexes: Dict[str, Pattern],
+        files: Sequence[Tuple[str, str]],
+    ) -> Dict[str, str]:
+        """
+        Returns matches of given (file name, path) pairs by given compiled regexes.
+
+        Return:
+            Dict[type, filepath] - type of entry to matching file
+        """
+        any_regex = cgttex.patterns.any_match_regex(
+            tuple((r.pattern, r.flags) for r in regexes.values())
+        )
+        if any_regex is not None:
+            # most files match none of the regexes, skip those with a single match call
+            files = [(f, path) for f, path in files if any_regex.match(f)]
+        return {
+            asset_type: filepath
+            for filename, filepath in files
+            for asset_type, re_obj in regexes.items()
+            if re_obj.match(filename)
+        }
+
     @staticmethod
     def matches_for_runner(
         runner: cgttex.patterns.TexPatterns,
@@ -108,9 +172,7 @@ class MultiTexPatterns:
         runner.reset_substitutions()
         runner.substitute(infile=infile, **parse_sources)
         runner.compile()
-        return {
-            asset_type: filepath
-            for filename, filepath in files.items()
-            for asset_type, re_obj in runner.input_files.items()
-            if re_obj.match(filename)
-        }
+        return MultiTexPatterns.match_files(
+            {asset_type: entry.compiled for asset_type, entry in runner.input_files.items()},
+            tuple(files.items()),
+        )
@@ -19,16 +19,18 @@
 This module contains code for finding texture files according to a naming convention.
 """
 
-from __future__ import (division, print_function, absolute_import, unicode_literals)
-
 import re
 import os
 import json
 import logging
+from functools import lru_cache
 from pprint import pformat
 
 logger = logging.getLogger(__name__)
 
+# substituted patterns repeat across materials sharing the same ids, and across pattern instances
+_compile = lru_cache(maxsize=2048)(re.compile)
+
 REQUIRED_TEXTURES = ["color", "metallic", "roughness", "normal", "occlusion"]
 
 PATTERN_TEMPLATES = {
@@ -219,7 +221,7 @@ class RegexEntry(PatternEntry):
     def compile(self):
         """Compiles and caches the regular expression"""
 
-        self.compiled = re.compile(self.get(), flags=self.flags)
+        self.compiled = _compile(self.get(), self.flags)
 
     def reset(self, compiled=True):
         """Resets substitutions, and compiled cache (optional)"""
@@ -242,6 +244,70 @@ class RegexEntry(PatternEntry):
         return ''.join(match.groups()) if match else None
 
 
+# leading global inline flags, e.g. "(?i)", they are kept in compiled pattern flags
+_INLINE_FLAGS = re.compile(r'^\(\?[aiLmsux]+\)')
+# group references, which would point to wrong groups once patterns are joined
+_GROUP_REFERENCE = re.compile(r'\\\d|\(\?P=|\(\?\(')
+
+
+@lru_cache(maxsize=256)
+def any_match_regex(patterns):
+    """
+    Returns a regex matching whenever any of given (pattern, flags) pairs would match,
+    or None if those can't be joined into a single regex.
+    Intended for skipping strings which would match none of the patterns with a single call.
+
+    Args:
+        patterns: tuple of (pattern string, flags) pairs, e.g. from compiled regexes
+    """
+    if len(patterns) < 2 or len({flags for _pattern, flags in patterns}) != 1:
+        return None
+
+    alternatives = []
+    for pattern, _flags in patterns:
+        if _GROUP_REFERENCE.search(pattern):
+            return None
+        alternatives.append('(?:{})'.format(_INLINE_FLAGS.sub('', pattern)))
+
+    try:
+        return re.compile('|'.join(alternatives), patterns[0][1])
+    except re.error:  # e.g. the same group name in multiple patterns
+        return None
+
+
+def walk_files(top, include_dir=None):
+    """
+    Yields (file name, path) pairs of all files in the tree of given directory,
+    in the same order as os.walk (top-down, not following symlinks, skipping unreadable dirs).
+    Unlike os.walk, does not build name lists, nor joins paths which DirEntry already has.
+
+    Args:
+        top:         directory to start from
+        include_dir: optional callable, sub-directories are only entered if it returns
+                     a truthy value for their name
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield entry.name, entry.path
+        elif not entry.is_symlink() and (include_dir is None or include_dir(entry.name)):
+            subdirs.append(entry.path)
+
+    for path in subdirs:
+        for item in walk_files(path, include_dir):
+            yield item
+
+
 class TexPatterns(object):
     """
     Class for texture filename discovery based on naming patterns.
@@ -512,20 +578,37 @@ class TexPatterns(object):
 
         found = {}
         to_find = dict(self.input_files)
+        for re_obj in to_find.values():
+            if not re_obj.compiled:
+                re_obj.compile()
+        # files matching none of the types are skipped with a single match call
+        any_regex = any_match_regex(
+            tuple((re_obj.compiled.pattern, re_obj.compiled.flags) for re_obj in to_find.values())
+        )
+
+        # filter directories to recurse into, by a single match call if possible
+        for re_obj_dir in self.input_directories:
+            if not re_obj_dir.compiled:
+                re_obj_dir.compile()
+        any_dir_regex = any_match_regex(
+            tuple((re_obj.compiled.pattern, re_obj.compiled.flags)
+                  for re_obj in self.input_directories)
+        )
+        if any_dir_regex is not None:
+            include_dir = any_dir_regex.match
+        else:
+            def include_dir(d):
+                return any((re_obj_dir.match(d) for re_obj_dir in self.input_directories))
+
         indir = os.path.dirname(infile)
-        for pdir, dirs, files in os.walk(indir):
-            for f in files:
-                for type, re_obj in to_find.items():
-                    if re_obj.match(f) and (type.lower() != "fbx"):
-                        found[type] = os.path.join(pdir, f) if abs_paths else f
-                        to_find.pop(type, None)
-                        break
-
-            # filter directories to recurse into
-            dirs[:] = [
-                d for d in dirs
-                if any((re_obj_dir.match(d) for re_obj_dir in self.input_directories))
-            ]
+        for f, path in walk_files(indir, include_dir):
+            if any_regex is not None and not any_regex.match(f):
+                continue
+            for type, re_obj in to_find.items():
+                if re_obj.match(f) and (type.lower() != "fbx"):
+                    found[type] = path if abs_paths else f
+                    to_find.pop(type, None)
+                    break
 
         return found
 